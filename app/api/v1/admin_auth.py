@@ -2,23 +2,31 @@
 from __future__ import annotations
 
 import json
+import logging
 import smtplib
+import threading
 from email.message import EmailMessage
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel, Field, ValidationError
 from starlette.responses import RedirectResponse
 
 from app.config import Settings, get_settings
 from app.db.models import AppSettings
 from app.db.session import get_db
-from app.security.crypto import decrypt_secret
+from app.security.crypto import decrypt_config_secret
 from app.security.csrf import csrf_issue_token
-from app.security.passwords import verify_password
+from app.security.passwords import verify_password_async
 from app.security.rate_limit import limiter
 from app.security.sessions import clear_admin_session, get_admin_session, set_admin_session
 
 router = APIRouter(tags=["admin"])
+logger = logging.getLogger(__name__)
+
+# Caps concurrent background SMTP sessions so a burst of forgot-password requests
+# cannot open an unbounded number of connections to the mail server. Sends over the cap
+# are dropped rather than waiting, since they would hold a shared threadpool slot.
+_SMTP_SEND_SEMAPHORE = threading.BoundedSemaphore(2)
 
 
 class AdminLoginBody(BaseModel):
@@ -48,8 +56,7 @@ def _send_admin_help_email(*, settings: Settings, to_email: str, cfg: AppSetting
     if cfg is None or not cfg.smtp_host or not cfg.smtp_port:
         return
 
-    smtp_secret = settings.smtp_password_secret or settings.session_secret
-    password = decrypt_secret(cfg.smtp_password, secret=smtp_secret) if cfg.smtp_password else None
+    password = decrypt_config_secret(cfg.smtp_password, settings=settings)
     username = (cfg.smtp_username or "").strip()
     from_email = (cfg.smtp_from_email or username or "").strip()
     if not from_email:
@@ -83,6 +90,19 @@ def _send_admin_help_email(*, settings: Settings, to_email: str, cfg: AppSetting
         server.quit()
 
 
+def _send_admin_help_email_in_background(*, settings: Settings, to_email: str, cfg: AppSettings | None) -> None:
+    # Runs after the response was sent; SMTP failures must not surface to the client.
+    if not _SMTP_SEND_SEMAPHORE.acquire(blocking=False):
+        logger.warning("Admin help e-mail dropped: too many SMTP sends in progress.")
+        return
+    try:
+        _send_admin_help_email(settings=settings, to_email=to_email, cfg=cfg)
+    except Exception:
+        logger.exception("Admin help e-mail could not be sent.")
+    finally:
+        _SMTP_SEND_SEMAPHORE.release()
+
+
 async def _parse_admin_login_body(request: Request) -> AdminLoginBody | None:
     raw_body = await request.body()
     payload: AdminLoginBody | None = None
@@ -115,13 +135,16 @@ async def _parse_admin_login_body(request: Request) -> AdminLoginBody | None:
 @router.post("/api/v1/admin/forgot-password")
 async def admin_forgot_password(
     payload: AdminForgotPasswordIn,
+    background_tasks: BackgroundTasks,
     settings: Settings = Depends(get_settings),
     db=Depends(get_db),
 ):
+    """Always answers immediately; the SMTP round-trip runs as a background task."""
+
     requested = payload.email.strip().lower()
     if requested == (settings.admin_username or "").strip().lower():
         cfg = _smtp_settings(db)
-        _send_admin_help_email(settings=settings, to_email=requested, cfg=cfg)
+        background_tasks.add_task(_send_admin_help_email_in_background, settings=settings, to_email=requested, cfg=cfg)
     return {"ok": True}
 
 
@@ -162,7 +185,7 @@ async def admin_login(
         raise HTTPException(status_code=400, detail="Vyplňte uživatelské jméno a heslo.")
 
     user_ok = username == configured_user
-    pass_ok = verify_password(payload.password, configured_hash)
+    pass_ok = await verify_password_async(payload.password, configured_hash)
 
     if not (user_ok and pass_ok):
         raise HTTPException(status_code=401, detail="Neplatné přihlašovací údaje")
@@ -164,7 +164,7 @@ def list_instances(
             id=i.id,
             client_type=i.client_type,
             device_fingerprint=i.device_fingerprint,
-            status=i.status.value,
+            status=InstanceStatus(i.status).value,
             display_name=i.display_name,
             created_at=i.created_at,
             last_seen_at=i.last_seen_at,
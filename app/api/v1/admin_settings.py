@@ -10,6 +10,7 @@ from app.api.deps import require_admin
 from app.db.models import AppSettings
 from app.db.session import get_db
 from app.security.csrf import require_csrf
+from app.utils.timeparse import minutes_to_hhmm
 
 router = APIRouter(prefix="/api/v1/admin/settings", tags=["admin-settings"])
 
@@ -26,12 +27,6 @@ def _hhmm_to_minutes(value: str) -> int:
         raise HTTPException(status_code=422, detail="Invalid time format, expected HH:MM.") from None
 
 
-def _minutes_to_hhmm(minutes: int) -> str:
-    h = minutes // 60
-    m = minutes % 60
-    return f"{h:02d}:{m:02d}"
-
-
 def _get_settings(db: Session) -> AppSettings:
     st = db.execute(select(AppSettings).where(AppSettings.id == 1)).scalars().first()
     if st is None:
@@ -53,7 +48,7 @@ class SettingsIn(BaseModel):
 @router.get("", response_model=SettingsOut)
 def get_settings(_admin=Depends(require_admin), db: Session = Depends(get_db)):
     st = _get_settings(db)
-    return SettingsOut(afternoon_cutoff=_minutes_to_hhmm(st.afternoon_cutoff_minutes))
+    return SettingsOut(afternoon_cutoff=minutes_to_hhmm(st.afternoon_cutoff_minutes))
 
 
 @router.put("")
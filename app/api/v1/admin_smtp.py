@@ -12,7 +12,7 @@ from app.api.deps import require_admin
 from app.config import Settings, get_settings
 from app.db.models import AppSettings
 from app.db.session import get_db
-from app.security.crypto import encrypt_secret
+from app.security.crypto import encrypt_config_secret
 from app.security.csrf import require_csrf
 
 router = APIRouter(prefix="/api/v1/admin/smtp", tags=["admin-smtp"])
@@ -78,8 +78,7 @@ def set_smtp(
     st.smtp_from_email = payload.from_email.strip() if payload.from_email else None
     st.smtp_from_name = payload.from_name.strip() if payload.from_name else None
     if payload.password:
-        smtp_secret = settings.smtp_password_secret or settings.session_secret
-        st.smtp_password = encrypt_secret(payload.password, secret=smtp_secret)
+        st.smtp_password = encrypt_config_secret(payload.password, settings=settings)
     st.smtp_updated_at = datetime.now()
     db.add(st)
     db.commit()
@@ -30,7 +30,7 @@ from app.db.models import (
     PortalUserRole,
 )
 from app.db.session import get_db
-from app.security.crypto import decrypt_secret
+from app.security.crypto import decrypt_config_secret
 from app.security.csrf import require_csrf
 from app.security.lockout import as_utc, clear_user_lockout, is_locked, revoke_unlock_tokens
 from app.security.passwords import hash_password
@@ -114,8 +114,7 @@ def _send_reset_email(*, settings: Settings, cfg: AppSettings, to_email: str, re
         raise ValueError("SMTP neni nastaveno.")
 
     username = (cfg.smtp_username or "").strip()
-    smtp_secret = settings.smtp_password_secret or settings.session_secret
-    decrypted_password = decrypt_secret(cfg.smtp_password, secret=smtp_secret) if cfg.smtp_password else None
+    decrypted_password = decrypt_config_secret(cfg.smtp_password, settings=settings)
     password = decrypted_password.strip() if decrypted_password else None
     security = (cfg.smtp_security or "SSL").strip().upper()
     from_email = (cfg.smtp_from_email or username or "").strip()
@@ -27,6 +27,7 @@ from app.services.employment_access import (
     select_login_employments,
 )
 from app.services.prague_time import prague_today
+from app.utils.timeparse import minutes_to_hhmm
 
 router = APIRouter(prefix="/api/v1/portal", tags=["portal-auth"])
 
@@ -64,12 +65,6 @@ class OkOut(BaseModel):
     ok: bool = True
 
 
-def _minutes_to_hhmm(minutes: int) -> str:
-    h = minutes // 60
-    m = minutes % 60
-    return f"{h:02d}:{m:02d}"
-
-
 def _get_settings(db: Session) -> AppSettings:
     st = db.execute(select(AppSettings).where(AppSettings.id == 1)).scalars().first()
     if st is None:
@@ -152,7 +147,7 @@ def portal_login(payload: PortalLoginIn, db: Session = Depends(get_db)):
         display_name=user.name,
         employment_id=selection.default.id if selection.default is not None else None,
         available_employments=[_to_login_employment_out(item, today) for item in selection.available],
-        afternoon_cutoff=_minutes_to_hhmm(st.afternoon_cutoff_minutes),
+        afternoon_cutoff=minutes_to_hhmm(st.afternoon_cutoff_minutes),
     )
 
 
@@ -6,16 +6,20 @@ from datetime import UTC, datetime
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, Field
-from sqlalchemy import select
+from pydantic import BaseModel, Field, field_validator
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.db.models import AppSettings, ClientType, Instance, InstanceStatus
 from app.db.session import get_db
 from app.security.tokens import rotate_instance_token
+from app.utils.timeparse import minutes_to_hhmm
 
 router = APIRouter(tags=["public-instances"])
 
+# Built once so the status poll reuses the same cached compiled statement.
+_INSTANCE_BY_ID = select(Instance).where(Instance.id == bindparam("instance_id"))
+
 
 class RegisterInstanceIn(BaseModel):
     client_type: ClientType
@@ -23,6 +27,11 @@ class RegisterInstanceIn(BaseModel):
     device_info: dict | None = None
     display_name: str | None = Field(default=None, max_length=128)
 
+    @field_validator("device_fingerprint", "display_name", mode="before")
+    @classmethod
+    def _strip(cls, value: object) -> object:
+        return value.strip() if isinstance(value, str) else value
+
 
 class RegisterInstanceOut(BaseModel):
     instance_id: str
@@ -41,15 +50,11 @@ class ClaimTokenOut(BaseModel):
     display_name: str | None = None
 
 
-def _minutes_to_hhmm(minutes: int) -> str:
-    return f"{minutes // 60:02d}:{minutes % 60:02d}"
-
-
 def _get_cutoff(db: Session) -> str:
     row = db.execute(select(AppSettings).where(AppSettings.id == 1)).scalars().first()
     if row is None:
         return "17:00"
-    return _minutes_to_hhmm(row.afternoon_cutoff_minutes)
+    return minutes_to_hhmm(row.afternoon_cutoff_minutes)
 
 
 @router.post("/api/v1/instances/register", response_model=RegisterInstanceOut)
@@ -58,28 +63,28 @@ def register_instance(payload: RegisterInstanceIn, db: Session = Depends(get_db)
     inst = Instance(
         id=str(uuid4()),
         client_type=payload.client_type,
-        device_fingerprint=payload.device_fingerprint.strip(),
+        device_fingerprint=payload.device_fingerprint,
         device_info_json=(json.dumps(payload.device_info, ensure_ascii=False) if payload.device_info else None),
         status=InstanceStatus.PENDING,
-        display_name=payload.display_name.strip() if payload.display_name else None,
+        display_name=payload.display_name or None,
         created_at=now,
         last_seen_at=now,
     )
     db.add(inst)
     db.commit()
-    return RegisterInstanceOut(instance_id=inst.id, status=inst.status.value)
+    return RegisterInstanceOut(instance_id=inst.id, status=inst.status)
 
 
 @router.get("/api/v1/instances/{instance_id}/status", response_model=InstanceStatusOut)
 def get_instance_status(instance_id: str, db: Session = Depends(get_db)) -> InstanceStatusOut:
-    inst = db.get(Instance, instance_id)
+    inst = db.execute(_INSTANCE_BY_ID, {"instance_id": instance_id}).scalar_one_or_none()
     if inst is None:
         raise HTTPException(status_code=404, detail="Instance not found")
     inst.last_seen_at = datetime.now(UTC)
     db.add(inst)
     db.commit()
 
-    out = InstanceStatusOut(status=inst.status.value)
+    out = InstanceStatusOut(status=inst.status)
     if inst.status == InstanceStatus.ACTIVE:
         out.display_name = inst.display_name
         out.employment_template = inst.employment_template
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import re
 from datetime import UTC, datetime
 from functools import lru_cache
 from typing import Literal, cast
@@ -16,6 +17,10 @@ _ENV_VALUES = ("production", "staging", "development")
 _SAMESITE_VALUES = ("lax", "strict")
 ADMIN_IDENTITY_EMAIL = "provoz@hotelchodovasc.cz"
 
+# Domains that must never appear in runtime config; matched in one pass per URL.
+_FORBIDDEN_DOMAINS = ("dochazka.hcasc.cz",)
+_FORBIDDEN_DOMAINS_RE = re.compile("|".join(map(re.escape, _FORBIDDEN_DOMAINS)))
+
 
 def _coerce_environment(value: str) -> Literal["production", "staging", "development"]:
     normalized = value.lower()
@@ -60,6 +65,9 @@ class Settings(BaseModel):
     db_pool_size: int = Field(default=5)
     db_max_overflow: int = Field(default=10)
     db_pool_timeout_seconds: int = Field(default=30)
+    db_pool_recycle_seconds: int = Field(default=1800)
+    db_pool_pre_ping: bool = Field(default=True)
+    db_query_cache_size: int = Field(default=1200, description="SQLAlchemy compiled statement cache size")
 
     # --- Admin auth (single admin account) ---
     admin_username: str = Field(default=ADMIN_IDENTITY_EMAIL)
@@ -118,12 +126,13 @@ class Settings(BaseModel):
 
     def ensure_canonical_domain(self) -> None:
         # Hard guard: forbid the incorrect domain anywhere in runtime config.
-        bad = "dochazka.hcasc.cz"
-        if bad in self.public_base_url:
-            raise ValueError(f"Invalid domain detected in public_base_url: {bad} is forbidden")
+        match = _FORBIDDEN_DOMAINS_RE.search(self.public_base_url)
+        if match:
+            raise ValueError(f"Invalid domain detected in public_base_url: {match.group(0)} is forbidden")
         for origin in self.cors_allow_origins:
-            if bad in origin:
-                raise ValueError(f"Invalid domain detected in cors_allow_origins: {bad} is forbidden")
+            match = _FORBIDDEN_DOMAINS_RE.search(origin)
+            if match:
+                raise ValueError(f"Invalid domain detected in cors_allow_origins: {match.group(0)} is forbidden")
 
     # Compatibility aliases for legacy code
     @property
@@ -174,8 +183,18 @@ def _load_env_file(path: str) -> None:
             os.environ.setdefault(k, v)
 
 
+DEFAULT_ENV_FILE = "/etc/dagmar/backend.env"
+
+
+def env_value(name: str, default: str, env_file: str = DEFAULT_ENV_FILE) -> str:
+    """Read one variable for import-time setup that runs before get_settings()."""
+
+    _load_env_file(env_file)
+    return os.getenv(name, default)
+
+
 @lru_cache(maxsize=1)
-def get_settings(env_file: str = "/etc/dagmar/backend.env") -> Settings:
+def get_settings(env_file: str = DEFAULT_ENV_FILE) -> Settings:
     # Load env file into process env if present.
     _load_env_file(env_file)
 
@@ -189,6 +208,9 @@ def get_settings(env_file: str = "/etc/dagmar/backend.env") -> Settings:
         db_pool_size=int(os.getenv("DAGMAR_DB_POOL_SIZE", "5")),
         db_max_overflow=int(os.getenv("DAGMAR_DB_MAX_OVERFLOW", "10")),
         db_pool_timeout_seconds=int(os.getenv("DAGMAR_DB_POOL_TIMEOUT_SECONDS", "30")),
+        db_pool_recycle_seconds=int(os.getenv("DAGMAR_DB_POOL_RECYCLE_SECONDS", "1800")),
+        db_pool_pre_ping=os.getenv("DAGMAR_DB_POOL_PRE_PING", "true").lower() == "true",
+        db_query_cache_size=int(os.getenv("DAGMAR_SQLA_CACHE_SIZE", "1200")),
         admin_username=ADMIN_IDENTITY_EMAIL,
         admin_password=os.getenv("DAGMAR_ADMIN_PASSWORD") or None,
         admin_password_hash=os.getenv("DAGMAR_ADMIN_PASSWORD_HASH") or None,
@@ -7,9 +7,9 @@ Create Date: 2026-02-16 00:00:00.000000
 
 from __future__ import annotations
 
-import re
 import unicodedata
 from collections.abc import Sequence
+from functools import lru_cache
 
 import sqlalchemy as sa
 from alembic import op
@@ -20,21 +20,25 @@ branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
 
+# After ASCII folding every non-alphanumeric character becomes a "." separator.
+_NON_ALNUM_TO_DOT = {cp: "." for cp in range(128) if not chr(cp).isalnum()}
+
+
+# Backfilled names repeat a lot (placeholder names, shared display names).
+@lru_cache(maxsize=4096)
 def _slugify(value: str) -> str:
     normalized = unicodedata.normalize("NFKD", value)
     ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
-    cleaned = re.sub(r"[^a-zA-Z0-9]+", ".", ascii_only.lower()).strip(".")
-    return re.sub(r"\.+", ".", cleaned)
+    dotted = ascii_only.lower().translate(_NON_ALNUM_TO_DOT)
+    # Splitting on "." and dropping empty parts collapses runs and trims the ends in one pass.
+    return ".".join(part for part in dotted.split(".") if part)
 
 
-def upgrade() -> None:
-    bind = op.get_bind()
-
-    existing_emails = {
-        row[0]
-        for row in bind.execute(sa.text("SELECT email FROM portal_users"))
-        if row[0]
-    }
+def _backfill(bind: sa.engine.Connection) -> None:
+    # Candidates always end in @migrated.local, so only those addresses can collide.
+    existing_emails = set(
+        bind.execute(sa.text("SELECT email FROM portal_users WHERE email LIKE '%@migrated.local'")).scalars()
+    )
 
     source_rows = bind.execute(
         sa.text(
@@ -48,6 +52,7 @@ def upgrade() -> None:
         )
     ).all()
 
+    params: list[dict[str, object]] = []
     for instance_id, display_name in source_rows:
         name = (display_name or "").strip() or f"Uživatel {str(instance_id)[:8]}"
         slug_base = _slugify(name) or "uzivatel"
@@ -59,20 +64,39 @@ def upgrade() -> None:
             candidate = f"{slug_base}.{idx}@migrated.local"
         existing_emails.add(candidate)
 
-        bind.execute(
-            sa.text(
-                """
-                INSERT INTO portal_users (email, name, role, password_hash, is_active, instance_id, created_at, updated_at)
-                VALUES (:email, :name, 'employee', NULL, true, :instance_id, NOW(), NOW())
-                """
-            ),
+        params.append(
             {
                 "email": candidate,
                 "name": name,
                 "instance_id": instance_id,
-            },
+            }
         )
 
+    if not params:
+        return
+
+    # Single executemany; the driver batches it instead of one round-trip per row.
+    bind.execute(
+        sa.text(
+            """
+            INSERT INTO portal_users (email, name, role, instance_id)
+            VALUES (:email, :name, 'employee', :instance_id)
+            """
+        ),
+        params,
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        # The backfill is idempotent (it skips instances that already have a user), so a
+        # lost commit after a crash is simply redone on the next upgrade.
+        bind.execute(sa.text("SET LOCAL synchronous_commit = off"))
+    # Slugs and collision numbering are resolved in Python on every dialect, against both
+    # existing addresses and the ones assigned earlier in this run, so no row is ever dropped.
+    _backfill(bind)
+
 
 def downgrade() -> None:
     bind = op.get_bind()
@@ -0,0 +1,37 @@
+"""Replace redundant shift plan indexes with composite ones.
+
+Revision ID: 2026_10_15_0015
+Revises: 2026_06_23_0014
+Create Date: 2026-10-15 09:00:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_10_15_0015"
+down_revision = "2026_06_23_0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # year leads uq_shift_plan_month_employment (year, month, employment_id), so that covers the
+    # year index. month is not a leading column, but no query filters on month without year; the
+    # rest go through the employment_id / instance_id indexes.
+    op.drop_index("ix_shift_plan_month_instances_year", table_name="shift_plan_month_instances")
+    op.drop_index("ix_shift_plan_month_instances_month", table_name="shift_plan_month_instances")
+
+    # Covered by uq_shift_plan_employment_date (employment_id, date).
+    op.drop_index("ix_shift_plan_employment_id", table_name="shift_plan")
+
+    # Instance lookups always come with a date (or none); one composite index serves both.
+    op.drop_index("ix_shift_plan_instance_id", table_name="shift_plan")
+    op.create_index("ix_shift_plan_instance_date", "shift_plan", ["instance_id", "date"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shift_plan_instance_date", table_name="shift_plan")
+    op.create_index("ix_shift_plan_instance_id", "shift_plan", ["instance_id"], unique=False)
+    op.create_index("ix_shift_plan_employment_id", "shift_plan", ["employment_id"], unique=False)
+    op.create_index("ix_shift_plan_month_instances_month", "shift_plan_month_instances", ["month"], unique=False)
+    op.create_index("ix_shift_plan_month_instances_year", "shift_plan_month_instances", ["year"], unique=False)
@@ -0,0 +1,53 @@
+"""Store attendance and shift plan times as SMALLINT minutes since midnight.
+
+Revision ID: 2026_10_15_0016
+Revises: 2026_10_15_0015
+Create Date: 2026-10-15 10:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_10_15_0016"
+down_revision = "2026_10_15_0015"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("attendance", "shift_plan")
+_COLUMNS = ("arrival_time", "departure_time")
+
+
+def _to_minutes(column: str) -> str:
+    value = f"NULLIF(btrim({column}), '')"
+    return f"split_part({value}, ':', 1)::smallint * 60 + split_part({value}, ':', 2)::smallint"
+
+
+def _to_hhmm(column: str) -> str:
+    return f"lpad(({column} / 60)::text, 2, '0') || ':' || lpad(mod({column}, 60)::text, 2, '0')"
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        for column in _COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.String(length=5),
+                type_=sa.SmallInteger(),
+                existing_nullable=True,
+                postgresql_using=_to_minutes(column),
+            )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        for column in _COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.SmallInteger(),
+                type_=sa.String(length=5),
+                existing_nullable=True,
+                postgresql_using=_to_hhmm(column),
+            )
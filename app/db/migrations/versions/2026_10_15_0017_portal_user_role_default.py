@@ -0,0 +1,23 @@
+"""Default portal_users.role to 'employee'.
+
+Revision ID: 2026_10_15_0017
+Revises: 2026_10_15_0016
+Create Date: 2026-10-15 11:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_10_15_0017"
+down_revision = "2026_10_15_0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column("portal_users", "role", server_default=sa.text("'employee'"))
+
+
+def downgrade() -> None:
+    op.alter_column("portal_users", "role", server_default=None)
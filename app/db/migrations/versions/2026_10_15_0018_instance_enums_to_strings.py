@@ -0,0 +1,71 @@
+"""Store instances.status and instances.client_type as strings with CHECK constraints.
+
+Revision ID: 2026_10_15_0018
+Revises: 2026_10_15_0017
+Create Date: 2026-10-15 12:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_10_15_0018"
+down_revision = "2026_10_15_0017"
+branch_labels = None
+depends_on = None
+
+_CLIENT_TYPES = ("ANDROID", "WEB")
+_STATUSES = ("PENDING", "ACTIVE", "REVOKED", "DEACTIVATED")
+
+
+def _in_list(column: str, values: tuple[str, ...]) -> str:
+    return f"{column} IN (" + ", ".join(f"'{value}'" for value in values) + ")"
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "instances",
+        "client_type",
+        existing_type=sa.Enum(*_CLIENT_TYPES, name="client_type"),
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using="client_type::text",
+    )
+    op.alter_column(
+        "instances",
+        "status",
+        existing_type=sa.Enum(*_STATUSES, name="instance_status"),
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using="status::text",
+    )
+    op.create_check_constraint("ck_instances_client_type", "instances", _in_list("client_type", _CLIENT_TYPES))
+    op.create_check_constraint("ck_instances_status", "instances", _in_list("status", _STATUSES))
+    op.execute("DROP TYPE IF EXISTS client_type")
+    op.execute("DROP TYPE IF EXISTS instance_status")
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_instances_status", "instances", type_="check")
+    op.drop_constraint("ck_instances_client_type", "instances", type_="check")
+    client_type = sa.Enum(*_CLIENT_TYPES, name="client_type")
+    status = sa.Enum(*_STATUSES, name="instance_status")
+    bind = op.get_bind()
+    client_type.create(bind, checkfirst=True)
+    status.create(bind, checkfirst=True)
+    op.alter_column(
+        "instances",
+        "status",
+        existing_type=sa.String(length=16),
+        type_=status,
+        existing_nullable=False,
+        postgresql_using="status::instance_status",
+    )
+    op.alter_column(
+        "instances",
+        "client_type",
+        existing_type=sa.String(length=16),
+        type_=client_type,
+        existing_nullable=False,
+        postgresql_using="client_type::client_type",
+    )
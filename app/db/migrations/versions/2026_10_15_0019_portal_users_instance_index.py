@@ -0,0 +1,22 @@
+"""Index portal_users.instance_id.
+
+Revision ID: 2026_10_15_0019
+Revises: 2026_10_15_0018
+Create Date: 2026-10-15 13:00:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_10_15_0019"
+down_revision = "2026_10_15_0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_portal_users_instance_id", "portal_users", ["instance_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_portal_users_instance_id", table_name="portal_users")
@@ -0,0 +1,29 @@
+"""Add instances.token_prefix for single-row token verification.
+
+Revision ID: 2026_10_15_0020
+Revises: 2026_10_15_0019
+Create Date: 2026-10-15 14:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_10_15_0020"
+down_revision = "2026_10_15_0019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing tokens are stored hashed only, so the prefix cannot be backfilled here. Those rows
+    # start NULL and verify_instance_token fills the prefix on their first successful verify;
+    # until then the lookup also matches token_prefix IS NULL. That fallback can only be dropped
+    # once no row is left NULL.
+    op.add_column("instances", sa.Column("token_prefix", sa.String(length=12), nullable=True))
+    op.create_index("ix_instances_token_prefix", "instances", ["token_prefix"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_instances_token_prefix", table_name="instances")
+    op.drop_column("instances", "token_prefix")
@@ -6,24 +6,52 @@ from enum import StrEnum
 from sqlalchemy import (
     JSON,
     Boolean,
+    CheckConstraint,
     Date,
     DateTime,
     Enum,
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     Text,
     UniqueConstraint,
     func,
 )
+from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
+
+from app.utils.timeparse import TimeParseError, is_valid_hhmm, minutes_to_hhmm
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class ClockMinutes(TypeDecorator[str]):
+    """"HH:MM" on the Python side, minutes since midnight (SMALLINT) in the database.
+
+    Binding anything but a 00:00-23:59 "HH:MM" string raises ``TimeParseError``.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> int | None:
+        if value is None:
+            return None
+        if not isinstance(value, str) or not is_valid_hhmm(value):
+            raise TimeParseError(f"Invalid clock time {value!r}, expected HH:MM in 00:00-23:59")
+        return int(value[:2]) * 60 + int(value[3:])
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        return minutes_to_hhmm(value)
+
+
 class InstanceStatus(StrEnum):
     PENDING = "PENDING"
     ACTIVE = "ACTIVE"
@@ -56,13 +84,12 @@ class Instance(Base):
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)  # UUID string
 
-    client_type: Mapped[ClientType] = mapped_column(Enum(ClientType, name="client_type", create_type=False), nullable=False)
+    # Plain strings guarded by CHECK constraints; compare against ClientType / InstanceStatus members.
+    client_type: Mapped[str] = mapped_column(String(16), nullable=False)
     device_fingerprint: Mapped[str] = mapped_column(String(128), nullable=False)
     device_info_json: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    status: Mapped[InstanceStatus] = mapped_column(
-        Enum(InstanceStatus, name="instance_status", create_type=False), nullable=False, default=InstanceStatus.PENDING
-    )
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default=InstanceStatus.PENDING.value)
     display_name: Mapped[str | None] = mapped_column(String(128), nullable=True)
     profile_instance_id: Mapped[str | None] = mapped_column(
         String(36), ForeignKey("instances.id", ondelete="SET NULL"), nullable=True
@@ -83,16 +110,27 @@ class Instance(Base):
         server_default=EmploymentTemplate.DPP_DPC.value,
     )
 
-    # Token is issued upon activation; store only a hash.
+    # Token is issued upon activation; store only a hash. token_prefix (sha256-derived, see
+    # app.security.tokens) narrows verification to a single row; NULL for tokens issued before it existed.
     token_hash: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    token_prefix: Mapped[str | None] = mapped_column(String(12), nullable=True)
     token_issued_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     last_seen_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     __table_args__ = (
+        CheckConstraint(
+            "client_type IN (" + ", ".join(f"'{item.value}'" for item in ClientType) + ")",
+            name="ck_instances_client_type",
+        ),
+        CheckConstraint(
+            "status IN (" + ", ".join(f"'{item.value}'" for item in InstanceStatus) + ")",
+            name="ck_instances_status",
+        ),
         Index("ix_instances_status", "status"),
         Index("ix_instances_last_seen_at", "last_seen_at"),
         Index("ix_instances_profile_instance_id", "profile_instance_id"),
+        Index("ix_instances_token_prefix", "token_prefix"),
     )
 
 
@@ -146,9 +184,9 @@ class Attendance(Base):
     )
     date: Mapped[date] = mapped_column(Date, nullable=False)
 
-    # Stored as "HH:MM" or NULL. Validation is performed in API layer.
-    arrival_time: Mapped[str | None] = mapped_column(String(5), nullable=True)
-    departure_time: Mapped[str | None] = mapped_column(String(5), nullable=True)
+    # Exposed as "HH:MM" or NULL, stored as minutes since midnight. Validation is performed in API layer.
+    arrival_time: Mapped[str | None] = mapped_column(ClockMinutes, nullable=True)
+    departure_time: Mapped[str | None] = mapped_column(ClockMinutes, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
@@ -176,8 +214,8 @@ class ShiftPlan(Base):
         String(36), ForeignKey("instances.id", ondelete="SET NULL"), nullable=True
     )
     date: Mapped[date] = mapped_column(Date, nullable=False)
-    arrival_time: Mapped[str | None] = mapped_column(String(5), nullable=True)
-    departure_time: Mapped[str | None] = mapped_column(String(5), nullable=True)
+    arrival_time: Mapped[str | None] = mapped_column(ClockMinutes, nullable=True)
+    departure_time: Mapped[str | None] = mapped_column(ClockMinutes, nullable=True)
     status: Mapped[str | None] = mapped_column(String(16), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, onupdate=func.now())
@@ -187,8 +225,7 @@ class ShiftPlan(Base):
 
     __table_args__ = (
         UniqueConstraint("employment_id", "date", name="uq_shift_plan_employment_date"),
-        Index("ix_shift_plan_employment_id", "employment_id"),
-        Index("ix_shift_plan_instance_id", "instance_id"),
+        Index("ix_shift_plan_instance_date", "instance_id", "date"),
         Index("ix_shift_plan_date", "date"),
     )
 
@@ -212,8 +249,6 @@ class ShiftPlanMonthInstance(Base):
 
     __table_args__ = (
         UniqueConstraint("year", "month", "employment_id", name="uq_shift_plan_month_employment"),
-        Index("ix_shift_plan_month_instances_year", "year"),
-        Index("ix_shift_plan_month_instances_month", "month"),
         Index("ix_shift_plan_month_instances_employment_id", "employment_id"),
         Index("ix_shift_plan_month_instances_instance_id", "instance_id"),
     )
@@ -272,7 +307,9 @@ class PortalUser(Base):
     name: Mapped[str] = mapped_column(String(160), nullable=False)
     phone: Mapped[str | None] = mapped_column(String(32), nullable=True)
     role: Mapped[PortalUserRole] = mapped_column(
-        Enum(PortalUserRole, name="portal_user_role", create_type=False), nullable=False
+        Enum(PortalUserRole, name="portal_user_role", create_type=False),
+        nullable=False,
+        server_default=PortalUserRole.EMPLOYEE.value,
     )
     password_hash: Mapped[str | None] = mapped_column(String(255), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default="true")
@@ -294,6 +331,8 @@ class PortalUser(Base):
         "Employment", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
     )
 
+    __table_args__ = (Index("ix_portal_users_instance_id", "instance_id"),)
+
 
 class PortalUserResetToken(Base):
     __tablename__ = "portal_user_reset_tokens"
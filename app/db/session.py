@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 
@@ -12,6 +13,10 @@ from app.config import get_settings
 _engine: Engine | None = None
 _SessionLocal: sessionmaker[Session] | None = None
 
+# Engines for explicit database URLs passed to session_scope(); one pool per URL.
+_url_sessionmakers: dict[str, sessionmaker[Session]] = {}
+_url_sessionmakers_lock = threading.Lock()
+
 
 def get_engine() -> Engine:
     """Singleton SQLAlchemy Engine.
@@ -21,23 +26,47 @@ def get_engine() -> Engine:
     - port: 5433
 
     The DATABASE_URL must be provided via /etc/dagmar/backend.env.
+
+    Multi-row writes such as ``session.execute(insert(Model), rows)`` are sent as
+    batched ``INSERT ... VALUES (...), (...)`` statements of up to 1000 rows each.
     """
 
     global _engine
     cfg = get_settings()
 
     if _engine is None:
-        # pool_pre_ping: avoid stale connections
+        # pool_recycle bounds connection age; pool_pre_ping (on by default) additionally
+        # checks each checkout and can be disabled for a healthy loopback Postgres.
+        # LIFO checkout keeps a small set of connections warm instead of cycling all of them.
         _engine = create_engine(
             cfg.database_url,
-            pool_pre_ping=True,
+            pool_pre_ping=cfg.db_pool_pre_ping,
+            pool_recycle=cfg.db_pool_recycle_seconds,
+            pool_use_lifo=True,
             pool_size=cfg.db_pool_size,
             max_overflow=cfg.db_max_overflow,
             pool_timeout=cfg.db_pool_timeout_seconds,
+            # Sized for all hot statements so polling endpoints never recompile SQL.
+            query_cache_size=cfg.db_query_cache_size,
+            insertmanyvalues_page_size=1000,
         )
     return _engine
 
 
+def dispose_engine_after_fork() -> None:
+    """Drop pooled connections inherited from a parent process (gunicorn preload_app).
+
+    close=False leaves the parent's sockets alone; the child simply starts with an empty pool.
+    """
+
+    if _engine is not None:
+        _engine.dispose(close=False)
+    for SessionLocal in _url_sessionmakers.values():
+        bind = SessionLocal.kw.get("bind")
+        if isinstance(bind, Engine):
+            bind.dispose(close=False)
+
+
 def get_sessionmaker() -> sessionmaker[Session]:
     global _SessionLocal
     if _SessionLocal is None:
@@ -62,12 +91,27 @@ def get_db() -> Generator[Session, None, None]:
     yield from db_session()
 
 
+def _sessionmaker_for_url(database_url: str) -> sessionmaker[Session]:
+    SessionLocal = _url_sessionmakers.get(database_url)
+    if SessionLocal is not None:
+        return SessionLocal
+    with _url_sessionmakers_lock:
+        SessionLocal = _url_sessionmakers.get(database_url)
+        if SessionLocal is None:
+            engine = create_engine(database_url, pool_pre_ping=True)
+            SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+            _url_sessionmakers[database_url] = SessionLocal
+    return SessionLocal
+
+
 @contextmanager
 def session_scope(database_url: str | None = None) -> Generator[Session, None, None]:
-    """Context manager for scripts and one-off tasks."""
+    """Context manager for scripts and one-off tasks.
+
+    Engines are reused across calls, so repeated scopes share one connection pool.
+    """
 
-    engine = create_engine(database_url, pool_pre_ping=True) if database_url else get_engine()
-    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    SessionLocal = _sessionmaker_for_url(database_url) if database_url else get_sessionmaker()
     db = SessionLocal()
     try:
         yield db
@@ -1,6 +1,9 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 DEFAULT_LOG_FORMAT = (
     "%(asctime)s %(levelname)s %(name)s "
@@ -8,12 +11,61 @@ DEFAULT_LOG_FORMAT = (
     "%(message)s"
 )
 
+# Formatters are stateless; one instance is shared by every handler.
+_FORMATTER = logging.Formatter(DEFAULT_LOG_FORMAT)
+
+ACCESS_LOGGER_NAME = "dagmar.access"
+
+# Arguments of the last applied configuration; repeated calls with the same ones are no-ops.
+_configured_key: tuple[object, ...] | None = None
+
+# Background threads writing the file handlers; requests only pay for an in-memory enqueue.
+# Each listener is kept with the QueueHandler feeding it so both can be rebuilt after fork.
+_listeners: list[tuple[QueueHandler, QueueListener]] = []
+
+
+def _ensure_parent_dirs(*paths: str | None) -> None:
+    parents = {os.path.dirname(path) for path in paths if path}
+    for parent in parents:
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+
+def _stop_listeners() -> None:
+    while _listeners:
+        _, listener = _listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _start_listener(queue_handler: QueueHandler, *handlers: logging.Handler) -> None:
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler.queue = log_queue
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append((queue_handler, listener))
+
+
+def _queued(handler: logging.Handler) -> QueueHandler:
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    _start_listener(queue_handler, handler)
+    return queue_handler
 
-def _ensure_parent_dir(path: str) -> None:
-    parent = os.path.dirname(path)
-    if not parent:
-        return
-    os.makedirs(parent, exist_ok=True)
+
+def _restart_listeners_after_fork() -> None:
+    # A forked child (gunicorn preload_app) inherits the QueueHandlers but not the listener
+    # threads; without new ones its file records would queue up and never be written.
+    # Records still queued in the parent at fork time belong to the parent.
+    inherited = list(_listeners)
+    _listeners.clear()
+    for queue_handler, listener in inherited:
+        _start_listener(queue_handler, *listener.handlers)
+
+
+atexit.register(_stop_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners_after_fork)
 
 
 def configure_logging(
@@ -28,47 +80,59 @@ def configure_logging(
 
     Production intent:
     - When running under systemd, journald will capture stdout/stderr.
-    - Optionally also write to log files under /var/log/dagmar/.
+    - Optionally also write to log files under /var/log/dagmar/; file writes and
+      rotation happen on a background QueueListener thread. Forked children (gunicorn
+      workers under preload_app) get fresh listener threads automatically.
 
     This function is deterministic and safe to call multiple times.
     """
 
+    global _configured_key
+
+    key = (level.upper(), log_file, access_log_file, max_bytes, backup_count)
+    if key == _configured_key:
+        return
+
     # Normalize level
     level_value = getattr(logging, level.upper(), logging.INFO)
 
-    # Reset root handlers to avoid duplicated logs on reload.
+    # Reset root and access handlers to avoid duplicated logs on reload. Closing releases
+    # file descriptors; the file handlers behind the queues are closed once drained.
     root = logging.getLogger()
     for h in list(root.handlers):
         root.removeHandler(h)
+        h.close()
+    access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+    for h in list(access_logger.handlers):
+        access_logger.removeHandler(h)
+        h.close()
+    _stop_listeners()
 
     root.setLevel(level_value)
 
-    formatter = logging.Formatter(DEFAULT_LOG_FORMAT)
-
-    # Always log to stdout (systemd/journald friendly)
-    stream_handler = logging.StreamHandler()
+    # Always log to stdout (systemd/journald friendly), synchronously
+    stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setLevel(level_value)
-    stream_handler.setFormatter(formatter)
+    stream_handler.setFormatter(_FORMATTER)
     root.addHandler(stream_handler)
 
     # Optional file logs
+    _ensure_parent_dirs(log_file, access_log_file)
     if log_file:
-        _ensure_parent_dir(log_file)
         file_handler = RotatingFileHandler(
             log_file, maxBytes=max_bytes, backupCount=backup_count
         )
         file_handler.setLevel(level_value)
-        file_handler.setFormatter(formatter)
-        root.addHandler(file_handler)
+        file_handler.setFormatter(_FORMATTER)
+        root.addHandler(_queued(file_handler))
 
     if access_log_file:
-        _ensure_parent_dir(access_log_file)
         access_handler = RotatingFileHandler(
             access_log_file, maxBytes=max_bytes, backupCount=backup_count
         )
         access_handler.setLevel(level_value)
-        access_handler.setFormatter(formatter)
-        logging.getLogger("dagmar.access").addHandler(access_handler)
+        access_handler.setFormatter(_FORMATTER)
+        access_logger.addHandler(_queued(access_handler))
 
     # Tame noisy loggers
     logging.getLogger("uvicorn").setLevel(level_value)
@@ -78,6 +142,18 @@ def configure_logging(
     logging.getLogger("gunicorn.error").setLevel(level_value)
     logging.getLogger("gunicorn.access").setLevel(level_value)
 
+    _configured_key = key
+
 
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
+
+
+def log_if(level: int, logger: logging.Logger, fmt: str, *args: object) -> None:
+    """Log with %-style args, skipping all work when the level is disabled.
+
+    Prefer this (or plain ``logger.debug("... %s", value)``) over f-strings, which are
+    formatted even when the record is filtered out.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, fmt, *args)
@@ -51,8 +51,8 @@ class _LimiterWithDefaults(Protocol):
     default_limits: list[str]
 
 
-def _now_ms() -> int:
-    return int(time.time() * 1000)
+# Liveness/version probes are polled constantly; they skip request ids and timing headers.
+_PROBE_PATHS = frozenset({"/api/health", "/api/v1/health", "/api/version"})
 
 
 def _deployed_backend_tag(settings: Settings) -> str:
@@ -143,7 +143,9 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 
     @app.middleware("http")
     async def request_id_and_timing(request: Request, call_next):
-        start_ms = _now_ms()
+        if request.url.path in _PROBE_PATHS:
+            return await call_next(request)
+        start_ns = time.perf_counter_ns()
         request.state.request_id = uuid.uuid4().hex
         response: JSONResponse | None = None
         is_integration = request.url.path.startswith(INTEGRATION_NAMESPACE)
@@ -175,7 +177,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
                 raise
         if response is None:
             raise RuntimeError("Middleware nevytvořila odpověď.")
-        dur_ms = _now_ms() - start_ms
+        dur_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         response.headers["X-Request-Duration-Ms"] = str(dur_ms)
         response.headers["X-Request-ID"] = ensure_request_id(request)
         if is_integration:
@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import base64
 import hashlib
+from functools import lru_cache
 
 from cryptography.fernet import Fernet, InvalidToken
 
+from app.config import Settings
+
 _ENC_PREFIX = "enc:v1:"
 
 
+@lru_cache(maxsize=8)
 def _fernet_from_secret(secret: str) -> Fernet:
+    # Key derivation and Fernet construction happen once per secret; Fernet is thread-safe.
     digest = hashlib.sha256(secret.encode("utf-8")).digest()
     key = base64.urlsafe_b64encode(digest)
     return Fernet(key)
@@ -19,13 +24,32 @@ def encrypt_secret(value: str, *, secret: str) -> str:
     return f"{_ENC_PREFIX}{token}"
 
 
-def decrypt_secret(value: str | None, *, secret: str) -> str | None:
+def _decrypt_with(fernet: Fernet, value: str | None) -> str | None:
     if not value:
         return None
     if not value.startswith(_ENC_PREFIX):
         return value
     token = value[len(_ENC_PREFIX) :]
     try:
-        return _fernet_from_secret(secret).decrypt(token.encode("utf-8")).decode("utf-8")
+        return fernet.decrypt(token.encode("utf-8")).decode("utf-8")
     except InvalidToken as exc:
         raise ValueError("Neplatný šifrovaný secret.") from exc
+
+
+def decrypt_secret(value: str | None, *, secret: str) -> str | None:
+    return _decrypt_with(_fernet_from_secret(secret), value)
+
+
+def _config_fernet(settings: Settings) -> Fernet:
+    # Stored SMTP credentials use the dedicated secret when configured, else the session secret.
+    return _fernet_from_secret(settings.smtp_password_secret or settings.session_secret)
+
+
+def encrypt_config_secret(value: str, *, settings: Settings) -> str:
+    token = _config_fernet(settings).encrypt(value.encode("utf-8")).decode("utf-8")
+    return f"{_ENC_PREFIX}{token}"
+
+
+def decrypt_config_secret(value: str | None, *, settings: Settings) -> str | None:
+    return _decrypt_with(_config_fernet(settings), value)
+
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import hmac
+import re
 import secrets
+import time
 from collections.abc import MutableMapping
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
 
 from fastapi import Header, HTTPException, Request, Response
 
@@ -35,15 +36,17 @@ class CsrfConfig:
     rotate_minutes: int = 120
 
 
+_FORM_CONTENT_TYPES = ("application/x-www-form-urlencoded", "multipart/form-data")
+_SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+# Issued tokens are secrets.token_urlsafe(32) (43 chars); anything else is rejected before comparing.
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_\-]{40,64}")
+
+
 class CsrfError(HTTPException):
     def __init__(self, detail: str = "CSRF validation failed"):
         super().__init__(status_code=403, detail=detail)
 
 
-def _utcnow() -> datetime:
-    return datetime.now(UTC)
-
-
 def _constant_time_eq(a: str, b: str) -> bool:
     # hmac.compare_digest is constant-time for equal-length strings.
     try:
@@ -73,7 +76,7 @@ def issue_csrf_token(session: MutableMapping[str, object], cfg: CsrfConfig | Non
     cfg = cfg or CsrfConfig()
     token = secrets.token_urlsafe(32)
     session["csrf_token"] = token
-    session["csrf_issued_at"] = _utcnow().isoformat()
+    session["csrf_issued_at"] = int(time.time())
     return token
 
 
@@ -92,18 +95,13 @@ def csrf_issue_token(
     settings = settings or get_settings()
     cfg = cfg or CsrfConfig()
 
-    session_store: MutableMapping[str, object] | None = None
-    if request is not None:
-        session_store = _get_request_session(request)
+    session_store = _get_request_session(request) if request is not None else None
 
+    # Rotation writes straight into the middleware-managed session, which persists it.
     session: MutableMapping[str, object] = session_store if session_store is not None else {}
 
     token = get_or_rotate_csrf_token(session, cfg)
 
-    # Persist into session for middleware-managed storage.
-    if session_store is not None:
-        session_store.update(session)
-
     if response is not None:
         response.headers[cfg.header_name] = token
         # CSRF token is not HttpOnly; expose for SPA consumption.
@@ -125,22 +123,22 @@ def get_or_rotate_csrf_token(session: MutableMapping[str, object], cfg: CsrfConf
     token = session.get("csrf_token")
     issued_at_raw = session.get("csrf_issued_at")
 
-    if not isinstance(token, str) or not isinstance(issued_at_raw, str):
+    # Epoch seconds; older sessions stored an ISO string and simply get a fresh token.
+    if not isinstance(token, str) or not isinstance(issued_at_raw, int):
         return issue_csrf_token(session, cfg)
 
-    try:
-        issued_at = datetime.fromisoformat(issued_at_raw)
-        if issued_at.tzinfo is None:
-            issued_at = issued_at.replace(tzinfo=UTC)
-    except Exception:
-        return issue_csrf_token(session, cfg)
-
-    if _utcnow() - issued_at > timedelta(minutes=cfg.rotate_minutes):
+    if time.time() - issued_at_raw > cfg.rotate_minutes * 60:
         return issue_csrf_token(session, cfg)
 
     return token
 
 
+def _valid_token(value: str | None) -> str | None:
+    if value and _TOKEN_RE.fullmatch(value):
+        return value
+    return None
+
+
 def extract_csrf_token(
     request: Request,
     csrf_header: str | None,
@@ -148,12 +146,12 @@ def extract_csrf_token(
 ) -> str | None:
     cfg = cfg or CsrfConfig()
     if csrf_header:
-        return csrf_header.strip()
+        return _valid_token(csrf_header)
 
     # Fallback: cookie set by csrf_issue_token (SPA může nepředat header).
     cookie_val = request.cookies.get("dagmar_csrf_token")
     if cookie_val:
-        return cookie_val.strip()
+        return _valid_token(cookie_val)
 
     # For classic HTML forms (admin UI), accept csrf_token form field.
     # Note: reading form requires async; thus this is used only in dependency below.
@@ -180,7 +178,7 @@ async def require_csrf(
       - For non-JSON form submits, token can be provided as form field 'csrf_token'.
     """
 
-    if request.method in ("GET", "HEAD", "OPTIONS"):
+    if request.method in _SAFE_METHODS:
         return
 
     session = _get_request_session(request)
@@ -193,15 +191,13 @@ async def require_csrf(
 
     provided = extract_csrf_token(request, csrf_header)
 
-    if not provided:
-        # Try form field.
+    content_type = request.headers.get("content-type", "")
+    if not provided and content_type.startswith(_FORM_CONTENT_TYPES):
+        # Try form field; JSON bodies never carry it, so they are not parsed as forms.
         try:
             form = await request.form()
             raw_token = form.get("csrf_token")
-            if isinstance(raw_token, str):
-                provided = raw_token.strip() or None
-            else:
-                provided = None
+            provided = _valid_token(raw_token) if isinstance(raw_token, str) else None
         except Exception:
             provided = None
 
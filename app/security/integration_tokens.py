@@ -7,16 +7,13 @@ import ipaddress
 import secrets
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import cast
 
-from passlib.context import CryptContext
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.config import Settings
 from app.db import models
-
-_pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+from app.security.passwords import argon2_hasher
 
 TOKEN_PREFIX_LEN = 16
 TOKEN_FINGERPRINT_LEN = 12
@@ -64,7 +61,7 @@ def validate_integration_token_format(token: str) -> bool:
 
 
 def token_prefix(token: str) -> str:
-    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:TOKEN_PREFIX_LEN]
+    return hashlib.sha256(token.encode("utf-8")).digest()[: TOKEN_PREFIX_LEN // 2].hex()
 
 
 def token_fingerprint(token: str) -> str:
@@ -72,12 +69,12 @@ def token_fingerprint(token: str) -> str:
 
 
 def hash_token(token: str) -> str:
-    return cast(str, _pwd_context.hash(token))
+    return argon2_hasher.hash(token)
 
 
 def verify_token(token: str, stored_hash: str) -> bool:
     try:
-        return bool(_pwd_context.verify(token, stored_hash))
+        return argon2_hasher.verify(stored_hash, token)
     except Exception:
         return False
 
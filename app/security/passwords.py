@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import re
 from dataclasses import dataclass
 
-from passlib.context import CryptContext
+import bcrypt
+from argon2 import PasswordHasher
 
-# Prefer Argon2 (modern, memory-hard). Fallback to bcrypt if needed.
-_pwd_context = CryptContext(
-    schemes=["argon2", "bcrypt"],
-    deprecated="auto",
-)
+# Argon2id with the parameters passlib used to emit, so existing hashes are not flagged
+# for rehash. Shared with instance and integration token hashing. bcrypt is only ever
+# verified (legacy accounts) and then upgraded.
+argon2_hasher = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=4, hash_len=32, salt_len=16)
+
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
 
 
 @dataclass(frozen=True)
@@ -33,7 +36,7 @@ def hash_password(password: str) -> PasswordHash:
         raise ValueError("password must be a non-empty string")
     if len(password) > 512:
         raise ValueError("password too long")
-    return PasswordHash(_pwd_context.hash(password))
+    return PasswordHash(argon2_hasher.hash(password))
 
 
 def _is_legacy_sha256_hash(password_hash: str) -> bool:
@@ -49,11 +52,15 @@ def verify_password_details(password: str, password_hash: str) -> PasswordVerifi
             valid=constant_time_equals(computed_hash, password_hash),
             needs_rehash=True,
         )
+    if password_hash.startswith(_BCRYPT_PREFIXES):
+        try:
+            valid = bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+        except ValueError:
+            valid = False
+        return PasswordVerification(valid=valid, needs_rehash=True)
     try:
-        return PasswordVerification(
-            valid=bool(_pwd_context.verify(password, password_hash)),
-            needs_rehash=bool(_pwd_context.needs_update(password_hash)),
-        )
+        argon2_hasher.verify(password_hash, password)
+        return PasswordVerification(valid=True, needs_rehash=argon2_hasher.check_needs_rehash(password_hash))
     except Exception:
         return PasswordVerification(valid=False)
 
@@ -62,19 +69,26 @@ def verify_password(password: str, password_hash: str) -> bool:
     return verify_password_details(password, password_hash).valid
 
 
+# Argon2 is deliberately slow; async endpoints must await this so the event loop keeps serving.
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    return await asyncio.to_thread(verify_password, password, password_hash)
+
+
 def is_password_hash_outdated(password_hash: str) -> bool:
     if not password_hash:
         return False
     if _is_legacy_sha256_hash(password_hash):
         return True
+    if password_hash.startswith(_BCRYPT_PREFIXES):
+        return True
     try:
-        return bool(_pwd_context.needs_update(password_hash))
+        return argon2_hasher.check_needs_rehash(password_hash)
     except Exception:
         return False
 
 
 def constant_time_equals(a: str, b: str) -> bool:
-    # Defensive helper; for password hashes passlib already does timing-safe checks.
+    # Defensive helper; for password hashes argon2/bcrypt already do timing-safe checks.
     a_b = a.encode("utf-8")
     b_b = b.encode("utf-8")
     return hmac.compare_digest(a_b, b_b)
@@ -7,10 +7,12 @@ Requirements (Section A.6 + B):
   - instance claim token polling
 
 Implementation notes:
-- We implement an in-process, per-worker limiter using SlowAPI.
-- For multi-worker deployments, consider a shared backend (e.g. Redis). This project
-  intentionally avoids external third-party services; a local Redis could be added,
-  but is not required by the spec.
+- We implement the limiter using SlowAPI; by default counters live in-process, per worker.
+- For multi-worker deployments set DAGMAR_RATE_LIMIT_STORAGE_URI to a shared backend
+  (e.g. a local redis://127.0.0.1:6379/1, requires the redis client package) so all
+  workers enforce one budget. The limiter is built from it at import, and the same
+  strategy (RATE_LIMIT_STRATEGY) applies to every backend. This project intentionally
+  avoids external third-party services, so the default stays memory://.
 
 This module exposes:
 - init_rate_limiting(app): attach SlowAPI limiter to FastAPI app
@@ -28,29 +30,42 @@ from fastapi import Request
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
-from slowapi.util import get_remote_address
+
+from app.config import env_value
 
 
 def _real_ip_keyfunc(request: Request) -> str:
     """Return best-effort real client IP.
 
-    We prefer X-Real-IP (set by Nginx) and fall back to SlowAPI's get_remote_address.
+    We prefer X-Real-IP (set by Nginx, already clean) and fall back to the peer address,
+    which is what SlowAPI's get_remote_address returns.
     """
     x_real = request.headers.get("x-real-ip")
     if x_real:
-        return x_real.strip()
+        return x_real
+
+    # Behind the reverse proxy the peer may be Nginx itself; Nginx should pass X-Real-IP.
+    # X-Forwarded-For is not used: its leading entry is client-controlled.
+    client = request.client
+    return client.host if client else "127.0.0.1"
+
+
+# One counting strategy for all storage backends, so limits mean the same everywhere.
+RATE_LIMIT_STRATEGY = "fixed-window"
+
 
-    # If behind reverse proxy, SlowAPI can read request.client.host (may be Nginx).
-    # Nginx should pass X-Real-IP; this is a fallback.
-    return get_remote_address(request)
+def _build_limiter(storage_uri: str) -> Limiter:
+    return Limiter(
+        key_func=_real_ip_keyfunc,
+        default_limits=[],  # no global default; apply per-route
+        headers_enabled=True,
+        storage_uri=storage_uri,
+        strategy=RATE_LIMIT_STRATEGY,
+    )
 
 
-# Global limiter instance used by the app
-limiter = Limiter(
-    key_func=_real_ip_keyfunc,
-    default_limits=[],  # no global default; apply per-route
-    headers_enabled=True,
-)
+# Global limiter instance used by the app; route decorators bind to it at import.
+limiter = _build_limiter(env_value("DAGMAR_RATE_LIMIT_STORAGE_URI", "memory://"))
 
 
 def init_rate_limiting(app) -> None:
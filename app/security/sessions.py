@@ -5,10 +5,13 @@ import hashlib
 import hmac
 import json
 import os
+import struct
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Literal
 
+from sqlalchemy import delete, select
 from starlette.requests import Request
 from starlette.responses import Response
 
@@ -58,6 +61,26 @@ class SessionCookieConfig:
     max_age_seconds: int = 60 * 60 * 12  # 12 hours
 
 
+# json.dumps() with non-default separators builds a new encoder per call; reuse one.
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+
+# Unpadded base64url of a 32-byte HMAC-SHA256 digest.
+_SIG_LEN = 43
+# "v1." + session id (>= 20 chars) + "." + signature.
+_MIN_COOKIE_LEN = 3 + 20 + 1 + _SIG_LEN
+_MAX_COOKIE_LEN = 256
+
+# Admin cookie payload: version byte, big-endian issued_at (unsigned 64-bit), UTF-8 username.
+# The version byte is signed too, so payloads of any other layout (e.g. the former JSON
+# object, which starts with "{") can never validate as this one.
+_ADMIN_PAYLOAD_VERSION = 2
+_ADMIN_HEADER = struct.Struct(">BQ")
+# Unpadded base64url of the header plus at least one username byte.
+_MIN_ADMIN_PAYLOAD_B64_LEN = 14
+# Tolerated clock difference between workers for cookies issued "in the future".
+_ADMIN_IAT_MAX_SKEW_SECONDS = 60
+
+
 def _b64url(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
 
@@ -67,15 +90,28 @@ def generate_session_id() -> str:
     return _b64url(os.urandom(32))
 
 
+@lru_cache(maxsize=1024)
 def session_id_hash(session_id: str) -> str:
     # Use SHA-256 over raw session id. We additionally namespace the hash.
+    # Cached: the helpers below hash the same id several times within a request.
     digest = hashlib.sha256(("dagmar:" + session_id).encode("utf-8")).hexdigest()
     return digest
 
 
+@lru_cache(maxsize=4)
+def _hmac_template(secret: str) -> hmac.HMAC:
+    # Keyed once; copy() clones the prepared inner/outer pads instead of re-deriving them.
+    return hmac.new(secret.encode("utf-8"), b"", hashlib.sha256)
+
+
+def _sign_bytes(payload: bytes, secret: str) -> str:
+    mac = _hmac_template(secret).copy()
+    mac.update(payload)
+    return _b64url(mac.digest())
+
+
 def _sign(payload: str, secret: str) -> str:
-    mac = hmac.new(secret.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256).digest()
-    return _b64url(mac)
+    return _sign_bytes(payload.encode("utf-8"), secret)
 
 
 def _encode_cookie_value(session_id: str, secret: str) -> str:
@@ -96,12 +132,16 @@ def _encode_cookie_value(session_id: str, secret: str) -> str:
 def _decode_cookie_value(cookie_value: str, secret: str) -> str | None:
     """Return session_id if signature matches, otherwise None."""
 
+    # Reject malformed values before paying for the HMAC.
+    if not cookie_value.startswith("v1.") or not _MIN_COOKIE_LEN <= len(cookie_value) <= _MAX_COOKIE_LEN:
+        return None
+
     try:
         parts = cookie_value.split(".")
         if len(parts) != 3:
             return None
         v, session_id, sig = parts
-        if v != "v1":
+        if v != "v1" or len(sig) != _SIG_LEN:
             return None
         payload = "v1." + session_id
         expected = _sign(payload, secret)
@@ -138,7 +178,7 @@ class AdminSessionData:
     issued_at: int
 
     def to_json(self) -> str:
-        return json.dumps({"admin_username": self.admin_username, "issued_at": self.issued_at}, separators=(",", ":"))
+        return _COMPACT_JSON.encode({"admin_username": self.admin_username, "issued_at": self.issued_at})
 
     @staticmethod
     def from_json(s: str) -> AdminSessionData:
@@ -193,7 +233,7 @@ def create_admin_session_row(
 
 def delete_admin_session_row(db: Any, *, session_id: str, AdminSessionModel: Any) -> None:
     h = session_id_hash(session_id)
-    db.query(AdminSessionModel).filter(AdminSessionModel.session_id_hash == h).delete()
+    db.execute(delete(AdminSessionModel).where(AdminSessionModel.session_id_hash == h))
     db.commit()
 
 
@@ -204,7 +244,7 @@ def load_admin_session_data(db: Any, *, session_id: str, AdminSessionModel: Any)
     """
 
     h = session_id_hash(session_id)
-    row = db.query(AdminSessionModel).filter(AdminSessionModel.session_id_hash == h).one_or_none()
+    row = db.execute(select(AdminSessionModel).where(AdminSessionModel.session_id_hash == h)).scalar_one_or_none()
     if row is None:
         return None
 
@@ -237,25 +277,27 @@ def prune_expired_sessions(db: Any, *, AdminSessionModel: Any, limit: int = 500)
     """
 
     now = int(time.time())
-    q = db.query(AdminSessionModel).filter(AdminSessionModel.expires_at < now).limit(int(limit))
-    rows = q.all()
-    if not rows:
-        return 0
-    n = len(rows)
-    for r in rows:
-        db.delete(r)
+    # One DELETE; the id subquery keeps the batch bound portable (no DELETE ... LIMIT).
+    expired_ids = select(AdminSessionModel.id).where(AdminSessionModel.expires_at < now).limit(int(limit))
+    result = db.execute(delete(AdminSessionModel).where(AdminSessionModel.id.in_(expired_ids)))
     db.commit()
-    return n
+    return int(result.rowcount or 0)
 
 
 # ---- Minimal cookie-based admin session helpers (no DB storage) ------------------------
 
+@lru_cache(maxsize=4)
+def _cookie_cfg(name: str, secure: bool, samesite: Literal["lax", "strict"], max_age_seconds: int) -> SessionCookieConfig:
+    return SessionCookieConfig(name=name, secure=secure, samesite=samesite, max_age_seconds=max_age_seconds)
+
+
 def _cookie_cfg_from_settings(settings: Settings) -> SessionCookieConfig:
-    return SessionCookieConfig(
-        name=settings.admin_session_cookie,
-        secure=settings.cookie_secure,
-        samesite=settings.cookie_samesite,
-        max_age_seconds=settings.session_max_age_seconds,
+    # Settings is not hashable, so the cache is keyed on the values the cookie config uses.
+    return _cookie_cfg(
+        settings.admin_session_cookie,
+        settings.cookie_secure,
+        settings.cookie_samesite,
+        settings.session_max_age_seconds,
     )
 
 
@@ -269,9 +311,9 @@ def set_admin_session(
 
     settings = settings or get_settings()
     issued_at = int(time.time())
-    payload = json.dumps({"u": username, "iat": issued_at}, separators=(",", ":"))
-    sig = _sign(payload, settings.session_secret)
-    token = f"{_b64url(payload.encode('utf-8'))}.{sig}"
+    payload = _ADMIN_HEADER.pack(_ADMIN_PAYLOAD_VERSION, issued_at) + username.encode("utf-8")
+    sig = _sign_bytes(payload, settings.session_secret)
+    token = f"{_b64url(payload)}.{sig}"
 
     cfg = _cookie_cfg_from_settings(settings)
     response.set_cookie(
@@ -311,29 +353,34 @@ def get_admin_session(
         payload_b64, sig = raw.split(".", 1)
     except ValueError:
         return AdminSession(username=None, issued_at=int(time.time()))
+    if len(payload_b64) < _MIN_ADMIN_PAYLOAD_B64_LEN or len(sig) != _SIG_LEN:
+        return AdminSession(username=None, issued_at=int(time.time()))
 
     try:
-        payload_bytes = base64.urlsafe_b64decode(payload_b64 + "==")
-        payload = payload_bytes.decode("utf-8")
+        payload = base64.urlsafe_b64decode(payload_b64 + "==")
     except Exception:
         return AdminSession(username=None, issued_at=int(time.time()))
 
-    expected_sig = _sign(payload, settings.session_secret)
+    expected_sig = _sign_bytes(payload, settings.session_secret)
     if not hmac.compare_digest(expected_sig, sig):
         return AdminSession(username=None, issued_at=int(time.time()))
 
-    try:
-        data = json.loads(payload)
-        username = str(data.get("u") or "")
-        issued_at = int(data.get("iat") or 0)
-    except Exception:
+    if len(payload) <= _ADMIN_HEADER.size:
         return AdminSession(username=None, issued_at=int(time.time()))
+    version, issued_at = _ADMIN_HEADER.unpack_from(payload, 0)
+    if version != _ADMIN_PAYLOAD_VERSION:
+        return AdminSession(username=None, issued_at=int(time.time()))
+    try:
+        username = payload[_ADMIN_HEADER.size :].decode("utf-8")
+    except UnicodeDecodeError:
+        return AdminSession(username=None, issued_at=issued_at)
 
     if not username:
         return AdminSession(username=None, issued_at=issued_at)
 
-    # Expiry check
-    if int(time.time()) - issued_at > cfg.max_age_seconds:
+    # Expiry check; cookies claiming to be issued in the future are never valid.
+    now = int(time.time())
+    if now - issued_at > cfg.max_age_seconds or issued_at > now + _ADMIN_IAT_MAX_SKEW_SECONDS:
         return AdminSession(username=None, issued_at=issued_at)
 
     return AdminSession(username=username, issued_at=issued_at)
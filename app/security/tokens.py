@@ -8,7 +8,7 @@ Requirements:
 Implementation notes:
 - We use a fixed prefix derived from the plaintext token (first 12 chars of SHA-256 hex)
   to find candidate row(s) quickly without storing plaintext.
-- The full token is hashed using bcrypt.
+- The full token is hashed using Argon2id.
 - Token format: dg_<base64url>
 
 This module is self-contained and does not depend on FastAPI.
@@ -20,21 +20,32 @@ import base64
 import hashlib
 import hmac
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import cast
 
-from passlib.context import CryptContext
+from sqlalchemy import or_
 
 from app.db import models
-
-# Use Argon2 to avoid bcrypt length limits and wrap-bug detection.
-_pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
-
+from app.security.passwords import argon2_hasher
 
 TOKEN_PREFIX_LEN = 12  # chars of sha256 hex
 TOKEN_BYTES = 32
 TOKEN_HUMAN_PREFIX = "dg_"
+# Minimum length: prefix + some payload.
+_TOKEN_MIN_LEN = len(TOKEN_HUMAN_PREFIX) + 16
+_TOKEN_MAX_LEN = 256
+
+# Successful verifications are remembered briefly so a busy instance does not pay Argon2 on
+# every request. Keys are HMACs under a per-process random key, never the plaintext token.
+_VERIFY_CACHE_TTL_SECONDS = 60.0
+_VERIFY_CACHE_MAX_ENTRIES = 4096
+_VERIFY_CACHE_KEY = secrets.token_bytes(32)
+_verify_cache: OrderedDict[bytes, tuple[str, str, float]] = OrderedDict()
+_verify_cache_lock = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -46,7 +57,7 @@ class TokenRecord:
 
 
 def _b64url(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
 
 
 def generate_instance_token() -> str:
@@ -62,22 +73,22 @@ def generate_instance_token() -> str:
 def token_prefix(token: str) -> str:
     """Compute deterministic prefix for DB lookup."""
 
-    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
-    return digest[:TOKEN_PREFIX_LEN]
+    # Hex-encode only the bytes we keep; identical to hexdigest()[:TOKEN_PREFIX_LEN].
+    return hashlib.sha256(token.encode("utf-8")).digest()[: TOKEN_PREFIX_LEN // 2].hex()
 
 
 def hash_token(token: str) -> str:
     """Hash plaintext token for storage."""
 
-    # passlib will generate salt internally
-    return cast(str, _pwd_context.hash(token))
+    # argon2 generates the salt internally
+    return argon2_hasher.hash(token)
 
 
 def verify_token(token: str, stored_hash: str) -> bool:
     """Verify token against stored hash."""
 
     try:
-        return bool(_pwd_context.verify(token, stored_hash))
+        return argon2_hasher.verify(stored_hash, token)
     except Exception:
         return False
 
@@ -96,12 +107,7 @@ def validate_token_format(token: str) -> bool:
 
     if not token.startswith(TOKEN_HUMAN_PREFIX):
         return False
-    # Minimum length: prefix + some payload
-    if len(token) < len(TOKEN_HUMAN_PREFIX) + 16:
-        return False
-    if len(token) > 256:
-        return False
-    return True
+    return _TOKEN_MIN_LEN <= len(token) <= _TOKEN_MAX_LEN
 
 
 def make_token_record(token: str) -> TokenRecord:
@@ -120,22 +126,77 @@ def maybe_redact(token: str | None) -> str:
     return token[:6] + "…" + token[-4:]
 
 
+def _verify_cache_key(raw_token: str) -> bytes:
+    return hmac.new(_VERIFY_CACHE_KEY, raw_token.encode("utf-8"), hashlib.sha256).digest()
+
+
+def _verify_cache_get(key: bytes) -> tuple[str, str] | None:
+    """Return (instance_id, token_hash) for a fresh entry."""
+
+    with _verify_cache_lock:
+        entry = _verify_cache.get(key)
+        if entry is None:
+            return None
+        instance_id, token_hash, expires_at = entry
+        if expires_at < time.monotonic():
+            del _verify_cache[key]
+            return None
+        return instance_id, token_hash
+
+
+def _verify_cache_put(key: bytes, instance_id: str, token_hash: str) -> None:
+    with _verify_cache_lock:
+        _verify_cache[key] = (instance_id, token_hash, time.monotonic() + _VERIFY_CACHE_TTL_SECONDS)
+        _verify_cache.move_to_end(key)
+        while len(_verify_cache) > _VERIFY_CACHE_MAX_ENTRIES:
+            _verify_cache.popitem(last=False)
+
+
+def _verify_cache_forget(*, key: bytes | None = None, instance_id: str | None = None) -> None:
+    with _verify_cache_lock:
+        if key is not None:
+            _verify_cache.pop(key, None)
+        if instance_id is not None:
+            for k in [k for k, entry in _verify_cache.items() if entry[0] == instance_id]:
+                del _verify_cache[k]
+
+
 def verify_instance_token(db, raw_token: str) -> models.Instance | None:
     """Find ACTIVE instance matching provided Bearer token."""
 
     if not validate_token_format(raw_token):
         return None
 
+    cache_key = _verify_cache_key(raw_token)
+    cached = _verify_cache_get(cache_key)
+    if cached is not None:
+        instance_id, cached_hash = cached
+        inst = db.get(models.Instance, instance_id)
+        # Rotation in any worker changes token_hash, which invalidates the entry here as well.
+        if inst is not None and inst.token_hash == cached_hash:
+            return cast(models.Instance, inst)
+        _verify_cache_forget(key=cache_key)
+
+    # Rows issued before token_prefix existed have it NULL; they stay candidates until a
+    # successful verification backfills their prefix. Exact prefix matches are tried first.
+    prefix = token_prefix(raw_token)
     instances = cast(
         list[models.Instance],
         db.query(models.Instance)
+        .filter(or_(models.Instance.token_prefix == prefix, models.Instance.token_prefix.is_(None)))
         .filter(models.Instance.token_hash.isnot(None))
         .filter(models.Instance.token_hash != "")
+        .order_by(models.Instance.token_prefix.is_(None))
         .all(),
     )
 
     for inst in instances:
         if inst.token_hash and verify_token(raw_token, inst.token_hash):
+            if inst.token_prefix is None:
+                inst.token_prefix = prefix
+                db.add(inst)
+                db.commit()
+            _verify_cache_put(cache_key, inst.id, inst.token_hash)
             return inst
     return None
 
@@ -150,6 +211,7 @@ def issue_instance_token_once(db, instance: models.Instance) -> str | None:
     rec = make_token_record(token)
 
     instance.token_hash = rec.token_hash
+    instance.token_prefix = rec.token_prefix
     instance.token_issued_at = datetime.now(UTC)
     db.add(instance)
     return token
@@ -157,9 +219,11 @@ def issue_instance_token_once(db, instance: models.Instance) -> str | None:
 
 def rotate_instance_token(db, instance: models.Instance) -> str:
     """Issue a fresh token even if one already exists (rotates/invalidates previous token)."""
+    _verify_cache_forget(instance_id=instance.id)
     token = generate_instance_token()
     rec = make_token_record(token)
     instance.token_hash = rec.token_hash
+    instance.token_prefix = rec.token_prefix
     instance.token_issued_at = datetime.now(UTC)
     db.add(instance)
     return token
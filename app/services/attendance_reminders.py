@@ -19,7 +19,7 @@ from app.db.models import (
     PortalUserRole,
     ShiftPlan,
 )
-from app.security.crypto import decrypt_secret
+from app.security.crypto import decrypt_config_secret
 from app.services.employment_access import employment_is_valid_on_day
 from app.services.prague_time import combine_prague, combine_prague_hhmm, prague_now
 
@@ -54,8 +54,7 @@ def _smtp_sender(settings: Settings, cfg: AppSettings) -> ReminderSender:
     port = cfg.smtp_port
     if port is None:
         raise ValueError("SMTP port neni nastaven.")
-    smtp_secret = settings.smtp_password_secret or settings.session_secret
-    decrypted_password = decrypt_secret(cfg.smtp_password, secret=smtp_secret) if cfg.smtp_password else None
+    decrypted_password = decrypt_config_secret(cfg.smtp_password, settings=settings)
     password = decrypted_password.strip() if decrypted_password else None
     security = (cfg.smtp_security or "SSL").strip().upper()
     from_email = (cfg.smtp_from_email or username or "").strip()
@@ -12,12 +12,20 @@ This module intentionally avoids locale-dependent behavior.
 from __future__ import annotations
 
 import re
+import sys
 import unicodedata
+from functools import lru_cache
 
-_WHITESPACE_RE = re.compile(r"\s+")
-_ALLOWED_RE = re.compile(r"[^a-z0-9_-]+")
-_UNDERSCORE_RUN_RE = re.compile(r"_+")
-_DASH_RUN_RE = re.compile(r"-+")
+# Whitespace, underscores and every other char outside [a-z0-9-] collapse into a single "_".
+_SEPARATOR_RUN_RE = re.compile(r"[^a-z0-9-]+")
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+
+@lru_cache(maxsize=1)
+def _combining_table() -> dict[int, None]:
+    # Every combining code point maps to None, so str.translate() drops them in one C-level pass.
+    # Built on first use rather than at import: scanning all code points takes tens of ms.
+    return {cp: None for cp in range(sys.maxunicode + 1) if unicodedata.combining(chr(cp))}
 
 
 def strip_diacritics(value: str) -> str:
@@ -26,12 +34,12 @@ def strip_diacritics(value: str) -> str:
     Example:
         "Žluťoučký kůň" -> "Zlutoucky kun"
     """
-    # NFKD splits base chars and combining marks.
-    normalized = unicodedata.normalize("NFKD", value)
-    # Remove combining marks.
-    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+    # NFKD splits base chars and combining marks; the table then removes the marks.
+    return unicodedata.normalize("NFKD", value).translate(_combining_table())
 
 
+# Exports slugify the same few instance names over and over; the function is pure.
+@lru_cache(maxsize=1024)
 def slugify_filename(value: str | None, *, max_len: int = 80) -> str:
     """Create a deterministic safe filename stem.
 
@@ -48,21 +56,13 @@ def slugify_filename(value: str | None, *, max_len: int = 80) -> str:
     if value is None:
         value = ""
 
-    value = value.strip()
-    value = strip_diacritics(value)
-    value = value.lower()
-
-    # Convert any whitespace run to underscore.
-    value = _WHITESPACE_RE.sub("_", value)
-
-    # Replace forbidden chars with underscore to keep readability.
-    value = _ALLOWED_RE.sub("_", value)
+    value = strip_diacritics(value).lower()
 
-    # Collapse runs.
-    value = _UNDERSCORE_RUN_RE.sub("_", value)
+    # Whitespace and forbidden chars become '_' (keeps readability), runs collapse in the same pass.
+    value = _SEPARATOR_RUN_RE.sub("_", value)
     value = _DASH_RUN_RE.sub("-", value)
 
-    # Trim separators.
+    # Trim separators (also covers leading/trailing whitespace).
     value = value.strip("_-")
 
     if not value:
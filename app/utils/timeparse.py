@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date
+from functools import lru_cache
 
 _TIME_RE = re.compile(r"^(?:[01]\d|2[0-3]):[0-5]\d$")
 
@@ -40,14 +41,22 @@ def parse_hhmm_or_none(value: str | None) -> str | None:
     return normalize_hhmm_or_none(value)
 
 
-_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+@lru_cache(maxsize=1500)
+def minutes_to_hhmm(minutes: int) -> str:
+    """Format minutes since midnight as HH:MM; the input space (0..1439) is small enough to cache."""
+    h, m = divmod(minutes, 60)
+    return f"{h:02d}:{m:02d}"
+
+
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
 
 
 def parse_yyyy_mm_dd(value: str) -> date:
-    if not isinstance(value, str) or _DATE_RE.match(value) is None:
+    if not isinstance(value, str) or _DATE_RE.fullmatch(value) is None:
         raise ValueError("Invalid date format, expected YYYY-MM-DD")
+    # The shape is already verified, so slice the fields instead of running strptime.
     try:
-        return datetime.strptime(value, "%Y-%m-%d").date()
+        return date(int(value[:4]), int(value[5:7]), int(value[8:]))
     except ValueError as e:
         raise ValueError("Invalid date") from e
 
@@ -71,11 +80,13 @@ class YearMonth:
         return YearMonth(year=y, month=m)
 
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 def days_in_month(year: int, month: int) -> int:
     # deterministic, no locale
-    if month == 12:
-        next_month = date(year + 1, 1, 1)
-    else:
-        next_month = date(year, month + 1, 1)
-    this_month = date(year, month, 1)
-    return (next_month - this_month).days
+    if not 1 <= month <= 12:
+        raise ValueError("month must be in 1..12")
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
@@ -5,6 +5,7 @@ Runs behind host-level Nginx at https://dagmar.hcasc.cz with proxy to:
 
 This file is intended to be used by systemd unit:
   ExecStart=... gunicorn -c /opt/dagmar/backend/gunicorn.conf.py app.main:app
+  CacheDirectory=dagmar   (writable bytecode cache, see pycache_dir)
 
 Notes:
 - Keep bind on loopback only.
@@ -13,6 +14,7 @@ Notes:
 
 import multiprocessing
 import os
+import sys
 
 
 def _int(env_name: str, default: int) -> int:
@@ -28,11 +30,18 @@ bind = "127.0.0.1:8101"
 # Worker model: UvicornWorker for ASGI (FastAPI)
 worker_class = "uvicorn.workers.UvicornWorker"
 
-# Deterministic-ish default workers; can be overridden via env.
+# One async worker per CPU (at least two); can be overridden via env.
 # For small deployments, 2-4 workers is usually sufficient.
-workers = _int("DAGMAR_GUNICORN_WORKERS", max(2, (multiprocessing.cpu_count() * 2) // 2))
+workers = _int("DAGMAR_GUNICORN_WORKERS", max(2, multiprocessing.cpu_count()))
 threads = _int("DAGMAR_GUNICORN_THREADS", 1)
 
+# Keep the worker heartbeat files on tmpfs so they never cause disk writes.
+worker_tmp_dir = os.getenv("DAGMAR_GUNICORN_WORKER_TMP_DIR") or ("/dev/shm" if os.path.isdir("/dev/shm") else None)
+
+# Recycle workers periodically to bound memory growth; jitter avoids restarting all at once.
+max_requests = _int("DAGMAR_GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = _int("DAGMAR_GUNICORN_MAX_REQUESTS_JITTER", 100)
+
 # Timeouts: keep sane values to avoid hanging workers.
 timeout = _int("DAGMAR_GUNICORN_TIMEOUT", 60)
 graceful_timeout = _int("DAGMAR_GUNICORN_GRACEFUL_TIMEOUT", 30)
@@ -43,8 +52,18 @@ accesslog = "-"
 errorlog = "-"
 loglevel = os.getenv("DAGMAR_LOG_LEVEL", "info")
 
-# Avoid writing .pyc into /opt if permissions are strict
-preload_app = False
+# Keep bytecode caches outside the (possibly read-only) install tree, e.g. in the systemd
+# CacheDirectory=dagmar. The interpreter reads PYTHONPYCACHEPREFIX only at start-up, so
+# sys.pycache_prefix is set here as well; it applies to the preloaded import below.
+pycache_dir = os.getenv("DAGMAR_PYCACHE_DIR", "/var/cache/dagmar/pycache")
+if os.access(os.path.dirname(pycache_dir), os.W_OK):
+    sys.pycache_prefix = pycache_dir
+else:
+    pycache_dir = ""
+
+# Import the app once in the master; workers fork and share its pages copy-on-write.
+# Code changes therefore need a full restart, not a HUP. See post_fork below.
+preload_app = True
 
 # Security / request sizing: DAGMAR API is small (no uploads)
 # Nginx should enforce its own limits; keep a minimal guard here.
@@ -62,3 +81,12 @@ raw_env = [
     "UVICORN_PROXY_HEADERS=1",
     "UVICORN_FORWARDED_ALLOW_IPS=" + forwarded_allow_ips,
 ]
+if pycache_dir:
+    raw_env.append("PYTHONPYCACHEPREFIX=" + pycache_dir)
+
+
+def post_fork(server, worker):
+    # Never share pooled DB connections across processes; each worker builds its own pool.
+    from app.db.session import dispose_engine_after_fork
+
+    dispose_engine_after_fork()
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import mmap
+import os
+import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -16,24 +21,58 @@ FORBIDDEN = [
     '"/' + "brand" + '/"',
 ]
 
+# All needles are ASCII: match them on raw bytes with one alternation, i.e. a single pass per file.
+FORBIDDEN_RE = re.compile(b"|".join(re.escape(needle.encode("ascii")) for needle in FORBIDDEN))
+
 SCAN_EXT = {".py", ".md", ".txt", ".json", ".yaml", ".yml", ".toml", ".ini", ".cfg", ".sh"}
 SKIP_DIRS = {".git", ".venv", "__pycache__", "node_modules"}
 
-violations: list[str] = []
-for path in ROOT.rglob("*"):
-    if any(part in SKIP_DIRS for part in path.parts):
-        continue
-    if not path.is_file() or path.suffix.lower() not in SCAN_EXT:
-        continue
-    text = path.read_text(encoding="utf-8", errors="ignore")
-    for needle in FORBIDDEN:
-        if needle in text:
-            violations.append(f"{path.relative_to(ROOT)} :: {needle}")
-
-if violations:
-    print("Legacy references found:")
-    for v in violations:
-        print(f" - {v}")
-    sys.exit(1)
-
-print("No legacy frontend references found.")
+# Below this many files, process start-up costs more than the scan itself.
+PARALLEL_MIN_FILES = 256
+
+
+def _walk(directory: str) -> Iterator[Path]:
+    # Prune skipped directories before entering them; scandir entries carry their file type.
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from _walk(entry.path)
+            elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in SCAN_EXT:
+                yield Path(entry.path)
+
+
+def _scan_file(path: Path) -> list[str]:
+    # Search the page-cache mapping directly instead of copying the file into memory.
+    with path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            found = {match.decode("ascii") for match in FORBIDDEN_RE.findall(mm)}
+    return [f"{path.relative_to(ROOT)} :: {needle}" for needle in FORBIDDEN if needle in found]
+
+
+def main() -> int:
+    paths = list(_walk(str(ROOT)))
+
+    violations: list[str] = []
+    if len(paths) < PARALLEL_MIN_FILES:
+        for path in paths:
+            violations.extend(_scan_file(path))
+    else:
+        with ProcessPoolExecutor() as executor:
+            for hits in executor.map(_scan_file, paths, chunksize=64):
+                violations.extend(hits)
+
+    if violations:
+        print("Legacy references found:")
+        for v in violations:
+            print(f" - {v}")
+        return 1
+
+    print("No legacy frontend references found.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
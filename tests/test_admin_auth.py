@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import json
 import os
+import threading
+import time
+from http.cookies import SimpleCookie
 
+import pytest
 from fastapi.testclient import TestClient
+from starlette.requests import Request
+from starlette.responses import Response
 
 os.environ.setdefault("DAGMAR_DATABASE_URL", "sqlite+pysqlite:///:memory:")
 os.environ.setdefault("DAGMAR_SESSION_SECRET", "x" * 32)
 os.environ.setdefault("DAGMAR_CSRF_SECRET", "y" * 32)
 
+from app.api.v1 import admin_auth
 from app.config import ADMIN_IDENTITY_EMAIL, get_settings
 from app.main import create_app
+from app.security import sessions
 from app.security.passwords import hash_password
+from app.security.sessions import get_admin_session, set_admin_session
 
 
 def _build_client() -> TestClient:
@@ -65,3 +75,80 @@ def test_admin_login_rejects_invalid_password_after_json_parse() -> None:
     )
     assert response.status_code == 401
     assert response.json()["detail"] == "Neplatné přihlašovací údaje"
+
+
+def _cookie_settings():
+    settings = get_settings.__wrapped__(env_file="missing.env")
+    settings.session_secret = "x" * 32
+    return settings
+
+
+def _issue_cookie(settings, username: str = ADMIN_IDENTITY_EMAIL) -> str:
+    response = Response()
+    set_admin_session(response, username=username, settings=settings)
+    cookie = SimpleCookie(response.headers["set-cookie"])
+    return cookie[settings.admin_session_cookie].value
+
+
+def _session_for(settings, cookie_value: str):
+    header = f"{settings.admin_session_cookie}={cookie_value}".encode("latin-1")
+    request = Request({"type": "http", "headers": [(b"cookie", header)]})
+    return get_admin_session(request, settings=settings)
+
+
+def test_admin_session_cookie_round_trip() -> None:
+    settings = _cookie_settings()
+    session = _session_for(settings, _issue_cookie(settings))
+    assert session.is_authenticated
+    assert session.username == ADMIN_IDENTITY_EMAIL
+
+
+def test_admin_session_cookie_rejects_tampered_signature() -> None:
+    settings = _cookie_settings()
+    payload_b64, sig = _issue_cookie(settings).split(".", 1)
+    tampered_sig = ("A" if sig[0] != "A" else "B") + sig[1:]
+    assert not _session_for(settings, f"{payload_b64}.{tampered_sig}").is_authenticated
+
+
+def test_admin_session_cookie_rejects_expired_and_future_cookies(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = _cookie_settings()
+    now = time.time()
+
+    monkeypatch.setattr(sessions.time, "time", lambda: now - settings.session_max_age_seconds - 60)
+    expired = _issue_cookie(settings)
+    monkeypatch.setattr(sessions.time, "time", lambda: now + 3600)
+    future = _issue_cookie(settings)
+    monkeypatch.setattr(sessions.time, "time", lambda: now)
+
+    assert not _session_for(settings, expired).is_authenticated
+    assert not _session_for(settings, future).is_authenticated
+
+
+def test_admin_session_cookie_rejects_legacy_json_payload() -> None:
+    settings = _cookie_settings()
+    # Former format: base64url(compact JSON) signed with the same secret.
+    payload = json.dumps({"u": ADMIN_IDENTITY_EMAIL, "iat": int(time.time())}, separators=(",", ":"))
+    sig = sessions._sign(payload, settings.session_secret)
+    legacy = f"{sessions._b64url(payload.encode('utf-8'))}.{sig}"
+    assert not _session_for(settings, legacy).is_authenticated
+
+
+def test_admin_help_email_is_dropped_when_smtp_slots_are_busy(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    sent: list[str] = []
+    monkeypatch.setattr(admin_auth, "_send_admin_help_email", lambda **kwargs: sent.append(kwargs["to_email"]))
+    monkeypatch.setattr(admin_auth, "_SMTP_SEND_SEMAPHORE", threading.BoundedSemaphore(1))
+    settings = _cookie_settings()
+
+    assert admin_auth._SMTP_SEND_SEMAPHORE.acquire(blocking=False)
+    with caplog.at_level("WARNING", logger=admin_auth.logger.name):
+        admin_auth._send_admin_help_email_in_background(settings=settings, to_email="a@example.com", cfg=None)
+    assert sent == []
+    assert "dropped" in caplog.text
+
+    admin_auth._SMTP_SEND_SEMAPHORE.release()
+    admin_auth._send_admin_help_email_in_background(settings=settings, to_email="a@example.com", cfg=None)
+    assert sent == ["a@example.com"]
+    # The slot is released again after the send.
+    assert admin_auth._SMTP_SEND_SEMAPHORE.acquire(blocking=False)
@@ -2,25 +2,15 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app.api.deps import require_admin
 from app.api.v1 import admin_smtp
-from app.db.models import AppSettings, Base
+from app.db.models import AppSettings
 
 
-def test_admin_smtp_get_never_leaks_password() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-
-    with SessionLocal() as db:
+def test_admin_smtp_get_never_leaks_password(session_local: sessionmaker[Session]) -> None:
+    with session_local() as db:
         db.add(AppSettings(id=1, afternoon_cutoff_minutes=17 * 60, smtp_password="top-secret"))
         db.commit()
 
@@ -28,7 +18,7 @@ def test_admin_smtp_get_never_leaks_password() -> None:
     app.include_router(admin_smtp.router)
 
     def override_db():
-        db: Session = SessionLocal()
+        db: Session = session_local()
         try:
             yield db
         finally:
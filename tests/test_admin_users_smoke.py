@@ -5,9 +5,8 @@ from datetime import UTC, date, datetime, timedelta
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app.api.deps import require_admin
 from app.api.v1 import admin_attendance, admin_shift_plan, admin_users, attendance, portal_auth
@@ -15,7 +14,6 @@ from app.api.v1.admin_employments import router as admin_employments_router
 from app.db.models import (
     Attendance,
     AttendanceLock,
-    Base,
     ClientType,
     Employment,
     Instance,
@@ -31,15 +29,7 @@ from app.security.passwords import hash_password
 from app.services.employment_access import add_calendar_months
 
 
-def _build_client() -> tuple[TestClient, sessionmaker[Session]]:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-
+def _build_client(session_local: sessionmaker[Session]) -> TestClient:
     app = FastAPI()
     app.include_router(admin_users.router)
     app.include_router(admin_employments_router)
@@ -49,7 +39,7 @@ def _build_client() -> tuple[TestClient, sessionmaker[Session]]:
     app.include_router(portal_auth.router)
 
     def override_db():
-        db = TestingSessionLocal()
+        db = session_local()
         try:
             yield db
         finally:
@@ -60,7 +50,7 @@ def _build_client() -> tuple[TestClient, sessionmaker[Session]]:
     app.dependency_overrides[require_admin] = lambda: {"username": "admin"}
     app.dependency_overrides[require_csrf] = lambda: None
 
-    return TestClient(app), TestingSessionLocal
+    return TestClient(app)
 
 
 def _create_user(
@@ -125,8 +115,8 @@ def _portal_login(client: TestClient, email: str, password: str = "StrongPass123
     return client.post("/api/v1/portal/login", json={"email": email, "password": password})
 
 
-def test_user_without_employment_cannot_login() -> None:
-    client, session_local = _build_client()
+def test_user_without_employment_cannot_login(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     with session_local() as db:
         _create_user(db, email="no-employment@example.com")
 
@@ -134,8 +124,8 @@ def test_user_without_employment_cannot_login() -> None:
     assert response.status_code == 403
 
 
-def test_user_with_open_ended_employment_can_login() -> None:
-    client, session_local = _build_client()
+def test_user_with_open_ended_employment_can_login(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     with session_local() as db:
         user = _create_user(db, email="employee@example.com")
         _add_employment(db, user, start_date=date(2025, 1, 1), end_date=None)
@@ -148,8 +138,8 @@ def test_user_with_open_ended_employment_can_login() -> None:
     assert len(payload["available_employments"]) == 1
 
 
-def test_manually_deactivated_user_with_valid_employment_cannot_login() -> None:
-    client, session_local = _build_client()
+def test_manually_deactivated_user_with_valid_employment_cannot_login(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     with session_local() as db:
         user = _create_user(db, email="deactivated@example.com", is_active=False)
         _add_employment(db, user, start_date=date(2025, 1, 1), end_date=None)
@@ -158,8 +148,8 @@ def test_manually_deactivated_user_with_valid_employment_cannot_login() -> None:
     assert response.status_code == 401
 
 
-def test_portal_reset_rejects_inactive_user() -> None:
-    client, session_local = _build_client()
+def test_portal_reset_rejects_inactive_user(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     with session_local() as db:
         user = _create_user(db, email="inactive-reset@example.com")
         token_value = "inactive-reset-token"
@@ -178,8 +168,8 @@ def test_portal_reset_rejects_inactive_user() -> None:
     assert response.status_code == 400
 
 
-def test_employment_starting_in_less_than_one_calendar_month_can_login() -> None:
-    client, session_local = _build_client()
+def test_employment_starting_in_less_than_one_calendar_month_can_login(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     today = date.today()
     with session_local() as db:
         user = _create_user(db, email="soon@example.com")
@@ -189,8 +179,8 @@ def test_employment_starting_in_less_than_one_calendar_month_can_login() -> None
     assert response.status_code == 200
 
 
-def test_employment_starting_in_more_than_one_calendar_month_cannot_login() -> None:
-    client, session_local = _build_client()
+def test_employment_starting_in_more_than_one_calendar_month_cannot_login(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     today = date.today()
     with session_local() as db:
         user = _create_user(db, email="later@example.com")
@@ -200,8 +190,8 @@ def test_employment_starting_in_more_than_one_calendar_month_cannot_login() -> N
     assert response.status_code == 403
 
 
-def test_employment_ended_less_than_one_calendar_month_ago_can_login() -> None:
-    client, session_local = _build_client()
+def test_employment_ended_less_than_one_calendar_month_ago_can_login(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     today = date.today()
     with session_local() as db:
         user = _create_user(db, email="recent-ended@example.com")
@@ -211,8 +201,8 @@ def test_employment_ended_less_than_one_calendar_month_ago_can_login() -> None:
     assert response.status_code == 200
 
 
-def test_employment_ended_more_than_one_calendar_month_ago_cannot_login() -> None:
-    client, session_local = _build_client()
+def test_employment_ended_more_than_one_calendar_month_ago_cannot_login(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     today = date.today()
     with session_local() as db:
         user = _create_user(db, email="old-ended@example.com")
@@ -222,8 +212,8 @@ def test_employment_ended_more_than_one_calendar_month_ago_cannot_login() -> Non
     assert response.status_code == 403
 
 
-def test_employment_period_change_with_out_of_range_data_returns_409() -> None:
-    client, session_local = _build_client()
+def test_employment_period_change_with_out_of_range_data_returns_409(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     with session_local() as db:
         user = _create_user(db, email="range-conflict@example.com")
         employment = _add_employment(db, user, start_date=date(2025, 1, 1), end_date=None)
@@ -243,8 +233,8 @@ def test_employment_period_change_with_out_of_range_data_returns_409() -> None:
     assert payload["requires_confirmation"] is True
 
 
-def test_confirmed_employment_period_change_deletes_out_of_range_data() -> None:
-    client, session_local = _build_client()
+def test_confirmed_employment_period_change_deletes_out_of_range_data(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     with session_local() as db:
         user = _create_user(db, email="range-confirm@example.com")
         employment = _add_employment(db, user, start_date=date(2025, 1, 1), end_date=None)
@@ -275,8 +265,8 @@ def test_confirmed_employment_period_change_deletes_out_of_range_data() -> None:
         assert refreshed.end_date == date(2026, 3, 11)
 
 
-def test_attendance_and_shift_plan_are_stored_by_employment_id() -> None:
-    client, session_local = _build_client()
+def test_attendance_and_shift_plan_are_stored_by_employment_id(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     target_day = date.today() - timedelta(days=1)
     with session_local() as db:
         user = _create_user(db, email="storage@example.com")
@@ -320,8 +310,8 @@ def test_attendance_and_shift_plan_are_stored_by_employment_id() -> None:
         assert shift_plan_row.instance_id == instance_id
 
 
-def test_portal_attendance_rejects_locked_month_for_read_and_write() -> None:
-    client, session_local = _build_client()
+def test_portal_attendance_rejects_locked_month_for_read_and_write(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     target_day = date(2026, 2, 10)
     with session_local() as db:
         user = _create_user(db, email="locked-month@example.com")
@@ -362,8 +352,8 @@ def test_portal_attendance_rejects_locked_month_for_read_and_write() -> None:
     assert write_response.status_code == 423
 
 
-def test_shift_plan_defaults_to_active_employments_and_keeps_inactive_available_for_filtering() -> None:
-    client, session_local = _build_client()
+def test_shift_plan_defaults_to_active_employments_and_keeps_inactive_available_for_filtering(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     with session_local() as db:
         first_user = _create_user(db, email="plan-first@example.com", name="První Uživatel")
         second_user = _create_user(db, email="plan-second@example.com", name="Druhý Uživatel")
@@ -398,8 +388,8 @@ def test_shift_plan_defaults_to_active_employments_and_keeps_inactive_available_
     assert payload["rows"][1]["days"][9]["arrival_time"] is None
 
 
-def test_employment_delete_with_related_data_returns_409_until_confirmed() -> None:
-    client, session_local = _build_client()
+def test_employment_delete_with_related_data_returns_409_until_confirmed(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     with session_local() as db:
         user = _create_user(db, email="delete-employment@example.com")
         employment = _add_employment(db, user, start_date=date(2025, 1, 1), end_date=None)
@@ -437,8 +427,8 @@ def test_employment_delete_with_related_data_returns_409_until_confirmed() -> No
         assert db.execute(select(ShiftPlan).where(ShiftPlan.employment_id == employment_id)).scalars().all() == []
 
 
-def test_delete_user_removes_user_and_employments() -> None:
-    client, session_local = _build_client()
+def test_delete_user_removes_user_and_employments(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
     with session_local() as db:
         user = _create_user(db, email="delete-user@example.com")
         employment = _add_employment(db, user, start_date=date(2025, 1, 1), end_date=None)
@@ -2,15 +2,12 @@ from __future__ import annotations
 
 from datetime import UTC, date, datetime
 
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app.config import Settings
 from app.db.models import (
     Attendance,
     AttendanceReminderEvent,
-    Base,
     ClientType,
     Employment,
     Instance,
@@ -31,17 +28,6 @@ def _settings() -> Settings:
     )
 
 
-def _session_local() -> sessionmaker[Session]:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-    return session_local
-
-
 def _seed_user_with_employment(db: Session, *, instance_id: str, name: str, email: str) -> Employment:
     instance = Instance(
         id=instance_id,
@@ -78,8 +64,7 @@ def _seed_user_with_employment(db: Session, *, instance_id: str, name: str, emai
     return employment
 
 
-def test_missing_arrival_reminder_is_sent_once_per_sequence() -> None:
-    session_local = _session_local()
+def test_missing_arrival_reminder_is_sent_once_per_sequence(session_local: sessionmaker[Session]) -> None:
 
     with session_local() as db:
         employment = _seed_user_with_employment(db, instance_id="inst-1", name="Jana", email="jana@example.com")
@@ -111,8 +96,7 @@ def test_missing_arrival_reminder_is_sent_once_per_sequence() -> None:
         assert db.query(AttendanceReminderEvent).count() == 3
 
 
-def test_missing_departure_reminder_starts_two_hours_after_planned_departure() -> None:
-    session_local = _session_local()
+def test_missing_departure_reminder_starts_two_hours_after_planned_departure(session_local: sessionmaker[Session]) -> None:
 
     with session_local() as db:
         employment = _seed_user_with_employment(db, instance_id="inst-2", name="Marie", email="marie@example.com")
@@ -144,8 +128,7 @@ def test_missing_departure_reminder_starts_two_hours_after_planned_departure() -
         ]
 
 
-def test_previous_day_missing_departure_reminder_runs_from_8am() -> None:
-    session_local = _session_local()
+def test_previous_day_missing_departure_reminder_runs_from_8am(session_local: sessionmaker[Session]) -> None:
 
     with session_local() as db:
         employment = _seed_user_with_employment(db, instance_id="inst-3", name="Eva", email="eva@example.com")
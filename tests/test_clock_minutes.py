@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import StatementError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models import Attendance, Employment, PortalUser, PortalUserRole, ShiftPlan
+from app.utils.timeparse import TimeParseError
+
+
+def _employment(db: Session) -> Employment:
+    user = PortalUser(
+        email="hodiny@example.com",
+        name="Hodiny",
+        role=PortalUserRole.EMPLOYEE,
+        is_active=True,
+        password_hash="x",
+    )
+    employment = Employment(
+        user=user,
+        title="Výchozí úvazek",
+        employment_type="DPP_DPC",
+        start_date=date(2025, 1, 1),
+        is_active=True,
+    )
+    db.add(employment)
+    db.commit()
+    return employment
+
+
+def test_clock_minutes_round_trip(session_local: sessionmaker[Session]) -> None:
+    with session_local() as db:
+        employment = _employment(db)
+        db.add(ShiftPlan(employment_id=employment.id, date=date(2026, 3, 2), arrival_time="07:05", departure_time="23:59"))
+        db.add(Attendance(employment_id=employment.id, date=date(2026, 3, 2), arrival_time="00:00", departure_time=None))
+        db.commit()
+
+        stored = db.execute(text("SELECT arrival_time, departure_time FROM shift_plan")).one()
+        assert tuple(stored) == (425, 1439)
+        assert db.execute(text("SELECT arrival_time, departure_time FROM attendance")).one() == (0, None)
+
+        db.expire_all()
+        plan = db.execute(select(ShiftPlan)).scalar_one()
+        assert (plan.arrival_time, plan.departure_time) == ("07:05", "23:59")
+        attendance = db.execute(select(Attendance)).scalar_one()
+        assert (attendance.arrival_time, attendance.departure_time) == ("00:00", None)
+
+        # The admin month view reads through a Core select on the table columns.
+        table = ShiftPlan.__table__
+        row = db.execute(select(table.c.arrival_time, table.c.departure_time)).mappings().one()
+        assert (row["arrival_time"], row["departure_time"]) == ("07:05", "23:59")
+
+        row = db.execute(select(table.c.date).where(table.c.arrival_time == "07:05")).one()
+        assert row.date == date(2026, 3, 2)
+
+
+@pytest.mark.parametrize("bad_value", ["7:05", "24:00", "07:60", "0705", "07:05:00", "", "ab:cd"])
+def test_clock_minutes_rejects_non_hhmm(session_local: sessionmaker[Session], bad_value: str) -> None:
+    with session_local() as db:
+        employment = _employment(db)
+        db.add(ShiftPlan(employment_id=employment.id, date=date(2026, 3, 2), arrival_time=bad_value))
+        with pytest.raises(StatementError) as excinfo:
+            db.commit()
+        assert isinstance(excinfo.value.orig, TimeParseError)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+
+os.environ.setdefault("DAGMAR_DATABASE_URL", "sqlite+pysqlite:///:memory:")
+os.environ.setdefault("DAGMAR_SESSION_SECRET", "x" * 32)
+os.environ.setdefault("DAGMAR_CSRF_SECRET", "y" * 32)
+
+from app.config import get_settings
+from app.security import csrf
+from app.security.csrf import csrf_issue_token, require_csrf
+
+
+def _build_client() -> TestClient:
+    settings = get_settings.__wrapped__(env_file="missing.env")
+    settings.cookie_secure = False
+
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="s" * 32)
+
+    @app.get("/csrf")
+    def issue(request: Request, response: Response) -> dict[str, str]:
+        return {"csrf_token": csrf_issue_token(request, response, settings=settings)}
+
+    @app.post("/protected", dependencies=[Depends(require_csrf)])
+    def protected() -> dict[str, bool]:
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def _issue(client: TestClient) -> str:
+    token = client.get("/csrf").json()["csrf_token"]
+    # Only exercise the value the test sends explicitly, not the mirrored cookie.
+    client.cookies.delete("dagmar_csrf_token")
+    return token
+
+
+@pytest.fixture
+def compare_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    calls: list[tuple[str, str]] = []
+    real_compare = csrf._constant_time_eq
+
+    def recording_compare(a: str, b: str) -> bool:
+        calls.append((a, b))
+        return real_compare(a, b)
+
+    monkeypatch.setattr(csrf, "_constant_time_eq", recording_compare)
+    return calls
+
+
+def test_valid_header_token_is_accepted(compare_calls: list[tuple[str, str]]) -> None:
+    client = _build_client()
+    token = _issue(client)
+    response = client.post("/protected", headers={"X-CSRF-Token": token})
+    assert response.status_code == 200
+    assert compare_calls == [(token, token)]
+
+
+@pytest.mark.parametrize("bad_value", ["neplatny token!", "a" * 39, "a" * 65, "a" * 4096, "a" * 42 + "="])
+def test_malformed_header_and_cookie_tokens_are_rejected_before_compare(
+    bad_value: str, compare_calls: list[tuple[str, str]]
+) -> None:
+    client = _build_client()
+    _issue(client)
+
+    via_header = client.post("/protected", headers={"X-CSRF-Token": bad_value})
+    assert via_header.status_code == 403
+    assert via_header.json()["detail"] == "Missing CSRF token"
+
+    client.cookies.set("dagmar_csrf_token", bad_value)
+    via_cookie = client.post("/protected")
+    assert via_cookie.status_code == 403
+    assert via_cookie.json()["detail"] == "Missing CSRF token"
+
+    assert compare_calls == []
+
+
+def test_form_field_token_is_accepted_for_form_posts() -> None:
+    client = _build_client()
+    token = _issue(client)
+    response = client.post("/protected", data={"csrf_token": token})
+    assert response.status_code == 200
+
+
+def test_json_post_does_not_parse_form(monkeypatch: pytest.MonkeyPatch) -> None:
+    form_calls = [0]
+    real_form = Request.form
+
+    def counting_form(self: Request, *args, **kwargs):
+        form_calls[0] += 1
+        return real_form(self, *args, **kwargs)
+
+    monkeypatch.setattr(Request, "form", counting_form)
+    client = _build_client()
+    _issue(client)
+
+    response = client.post("/protected", json={"csrf_token": "ignored"})
+    assert response.status_code == 403
+    assert form_calls[0] == 0
+
+
+def test_fresh_token_is_reused() -> None:
+    session: dict[str, object] = {}
+    token = csrf.get_or_rotate_csrf_token(session)
+    assert csrf.get_or_rotate_csrf_token(session) == token
+
+
+def test_legacy_iso_issued_at_is_reissued() -> None:
+    session: dict[str, object] = {"csrf_token": "a" * 43, "csrf_issued_at": "2026-01-01T00:00:00+00:00"}
+    token = csrf.get_or_rotate_csrf_token(session)
+    assert token != "a" * 43
+    assert isinstance(session["csrf_issued_at"], int)
+
+
+def test_token_rotates_after_rotate_minutes(monkeypatch: pytest.MonkeyPatch) -> None:
+    cfg = csrf.CsrfConfig(rotate_minutes=30)
+    session: dict[str, object] = {}
+    now = 1_800_000_000.0
+    monkeypatch.setattr(csrf.time, "time", lambda: now)
+    token = csrf.get_or_rotate_csrf_token(session, cfg)
+
+    monkeypatch.setattr(csrf.time, "time", lambda: now + 30 * 60)
+    assert csrf.get_or_rotate_csrf_token(session, cfg) == token
+
+    monkeypatch.setattr(csrf.time, "time", lambda: now + 30 * 60 + 1)
+    rotated = csrf.get_or_rotate_csrf_token(session, cfg)
+    assert rotated != token
+    assert session["csrf_issued_at"] == int(now + 30 * 60 + 1)
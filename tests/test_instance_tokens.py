@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models import ClientType, Instance, InstanceStatus
+from app.security import tokens
+from app.security.tokens import (
+    generate_instance_token,
+    hash_token,
+    rotate_instance_token,
+    token_prefix,
+    verify_instance_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def _empty_verify_cache() -> Iterator[None]:
+    tokens._verify_cache.clear()
+    yield
+    tokens._verify_cache.clear()
+
+
+def _instance(db: Session, instance_id: str) -> Instance:
+    inst = Instance(
+        id=instance_id,
+        client_type=ClientType.WEB.value,
+        device_fingerprint=f"fp-{instance_id}",
+        status=InstanceStatus.ACTIVE.value,
+    )
+    db.add(inst)
+    db.flush()
+    return inst
+
+
+def test_verify_instance_token_finds_row_by_prefix(session_local: sessionmaker[Session]) -> None:
+    with session_local() as db:
+        first = _instance(db, "inst-1")
+        second = _instance(db, "inst-2")
+        first_token = rotate_instance_token(db, first)
+        second_token = rotate_instance_token(db, second)
+        db.commit()
+
+        assert first.token_prefix == token_prefix(first_token)
+        found = verify_instance_token(db, second_token)
+        assert found is not None and found.id == "inst-2"
+        assert verify_instance_token(db, generate_instance_token()) is None
+
+
+def test_verify_instance_token_backfills_legacy_prefix(session_local: sessionmaker[Session]) -> None:
+    legacy_token = generate_instance_token()
+    with session_local() as db:
+        legacy = _instance(db, "inst-legacy")
+        legacy.token_hash = hash_token(legacy_token)
+        db.commit()
+        assert legacy.token_prefix is None
+
+        found = verify_instance_token(db, legacy_token)
+        assert found is not None and found.id == "inst-legacy"
+
+    with session_local() as db:
+        stored = db.get(Instance, "inst-legacy")
+        assert stored is not None
+        assert stored.token_prefix == token_prefix(legacy_token)
+
+
+def _count_argon2(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls = [0]
+    real_verify = tokens.verify_token
+
+    def counting_verify(token: str, stored_hash: str) -> bool:
+        calls[0] += 1
+        return real_verify(token, stored_hash)
+
+    monkeypatch.setattr(tokens, "verify_token", counting_verify)
+    return calls
+
+
+def test_verify_cache_hit_skips_argon2(session_local: sessionmaker[Session], monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_argon2(monkeypatch)
+    with session_local() as db:
+        token = rotate_instance_token(db, _instance(db, "inst-1"))
+        db.commit()
+
+        assert verify_instance_token(db, token) is not None
+        assert calls[0] == 1
+        found = verify_instance_token(db, token)
+        assert found is not None and found.id == "inst-1"
+        assert calls[0] == 1
+
+
+def test_verify_cache_is_invalidated_by_rotation_and_revocation(session_local: sessionmaker[Session]) -> None:
+    with session_local() as db:
+        inst = _instance(db, "inst-1")
+        old_token = rotate_instance_token(db, inst)
+        db.commit()
+        assert verify_instance_token(db, old_token) is not None
+
+        new_token = rotate_instance_token(db, inst)
+        db.commit()
+        assert verify_instance_token(db, old_token) is None
+        assert verify_instance_token(db, new_token) is not None
+
+        # Admin revoke/deactivate paths only clear token_hash; the cached entry must not survive.
+        inst.token_hash = None
+        db.commit()
+        assert verify_instance_token(db, new_token) is None
+
+
+def test_verify_cache_entries_expire(session_local: sessionmaker[Session], monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_argon2(monkeypatch)
+    now = [1000.0]
+    monkeypatch.setattr(tokens.time, "monotonic", lambda: now[0])
+    with session_local() as db:
+        token = rotate_instance_token(db, _instance(db, "inst-1"))
+        db.commit()
+
+        assert verify_instance_token(db, token) is not None
+        now[0] += tokens._VERIFY_CACHE_TTL_SECONDS + 1
+        assert verify_instance_token(db, token) is not None
+        assert calls[0] == 2
+
+
+def test_verify_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tokens, "_VERIFY_CACHE_MAX_ENTRIES", 2)
+    for key in (b"a", b"b", b"c"):
+        tokens._verify_cache_put(key, key.decode(), "hash")
+
+    assert list(tokens._verify_cache) == [b"b", b"c"]
+    assert tokens._verify_cache_get(b"a") is None
+    assert tokens._verify_cache_get(b"c") == ("c", "hash")
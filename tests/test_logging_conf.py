@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from app import logging_conf
+
+
+@pytest.fixture
+def restore_logging() -> Iterator[None]:
+    root = logging.getLogger()
+    saved_handlers = list(root.handlers)
+    saved_level = root.level
+    try:
+        yield
+    finally:
+        logging_conf._stop_listeners()
+        logging_conf._configured_key = None
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
+        access_logger = logging.getLogger(logging_conf.ACCESS_LOGGER_NAME)
+        for handler in list(access_logger.handlers):
+            access_logger.removeHandler(handler)
+
+
+@pytest.mark.usefixtures("restore_logging")
+def test_queued_file_handler_writes_records(tmp_path: Path) -> None:
+    log_file = tmp_path / "logs" / "app.log"
+    access_log_file = tmp_path / "logs" / "access.log"
+    logging_conf.configure_logging(level="INFO", log_file=str(log_file), access_log_file=str(access_log_file))
+
+    logging.getLogger("dagmar.test").info("zaznam do souboru")
+    logging.getLogger(logging_conf.ACCESS_LOGGER_NAME).info("GET /api/v1/health 200")
+    # Stopping drains the queues and closes the file handlers.
+    logging_conf._stop_listeners()
+
+    assert "zaznam do souboru" in log_file.read_text()
+    assert "GET /api/v1/health 200" in access_log_file.read_text()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+@pytest.mark.usefixtures("restore_logging")
+def test_forked_child_gets_its_own_listener(tmp_path: Path) -> None:
+    log_file = tmp_path / "app.log"
+    logging_conf.configure_logging(level="INFO", log_file=str(log_file))
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        status = 1
+        try:
+            logging.getLogger("dagmar.test").info("zaznam z workeru")
+            logging_conf._stop_listeners()
+            status = 0
+        finally:
+            os._exit(status)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    logging_conf._stop_listeners()
+    assert "zaznam z workeru" in log_file.read_text()
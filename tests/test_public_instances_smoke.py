@@ -4,39 +4,29 @@ from datetime import UTC, datetime
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app.api.v1 import public_instances
-from app.db.models import AppSettings, Base, Instance, InstanceStatus
+from app.db.models import AppSettings, Instance, InstanceStatus
 
 
-def _build_client() -> tuple[TestClient, sessionmaker[Session]]:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-
+def _build_client(session_local: sessionmaker[Session]) -> TestClient:
     app = FastAPI()
     app.include_router(public_instances.router)
 
     def override_db():
-        db = TestingSessionLocal()
+        db = session_local()
         try:
             yield db
         finally:
             db.close()
 
     app.dependency_overrides[public_instances.get_db] = override_db
-    return TestClient(app), TestingSessionLocal
+    return TestClient(app)
 
 
-def test_public_instance_lifecycle_smoke() -> None:
-    client, session_local = _build_client()
+def test_public_instance_lifecycle_smoke(session_local: sessionmaker[Session]) -> None:
+    client = _build_client(session_local)
 
     register = client.post(
         "/api/v1/instances/register",
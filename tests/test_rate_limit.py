@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from limits.strategies import FixedWindowRateLimiter
+
+from app.config import env_value
+from app.security.rate_limit import RATE_LIMIT_STRATEGY, _build_limiter, init_rate_limiting, limiter
+
+
+def test_limiter_is_built_from_env_with_one_strategy() -> None:
+    assert limiter._storage_uri == os.getenv("DAGMAR_RATE_LIMIT_STORAGE_URI", "memory://")
+    for candidate in (limiter, _build_limiter("memory://")):
+        assert candidate._strategy == RATE_LIMIT_STRATEGY
+        assert isinstance(candidate._limiter, FixedWindowRateLimiter)
+
+
+def test_env_value_reads_env_file_without_overriding_process_env(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    env_file = tmp_path / "backend.env"
+    env_file.write_text("DAGMAR_TEST_FROM_FILE=redis://127.0.0.1:6379/1\nDAGMAR_TEST_SET=file\n", encoding="utf-8")
+    monkeypatch.delenv("DAGMAR_TEST_FROM_FILE", raising=False)
+    monkeypatch.setenv("DAGMAR_TEST_SET", "process")
+
+    assert env_value("DAGMAR_TEST_FROM_FILE", "memory://", env_file=str(env_file)) == "redis://127.0.0.1:6379/1"
+    assert env_value("DAGMAR_TEST_SET", "memory://", env_file=str(env_file)) == "process"
+    assert env_value("DAGMAR_TEST_MISSING", "memory://", env_file=str(env_file)) == "memory://"
+    # The loader writes into os.environ directly; do not leak the value into other tests.
+    os.environ.pop("DAGMAR_TEST_FROM_FILE", None)
+
+
+def test_route_limit_returns_json_429() -> None:
+    app = FastAPI()
+    init_rate_limiting(app)
+
+    @app.get("/limited")
+    @limiter.limit("2/minute")
+    def limited(request: Request, response: Response) -> dict[str, bool]:
+        return {"ok": True}
+
+    client = TestClient(app)
+    headers = {"X-Real-IP": "203.0.113.7"}
+    assert client.get("/limited", headers=headers).status_code == 200
+    assert client.get("/limited", headers=headers).status_code == 200
+    blocked = client.get("/limited", headers=headers)
+    assert blocked.status_code == 429
+    assert blocked.json()["error"]["code"] == "RATE_LIMITED"
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from app.utils.timeparse import parse_yyyy_mm_dd
+
+
+def test_parse_yyyy_mm_dd_accepts_iso_dates() -> None:
+    assert parse_yyyy_mm_dd("2024-02-29") == date(2024, 2, 29)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "٢٠٢٤-٠٢-٢٩",  # Arabic-Indic digits
+        "２０２４-０２-２９",  # fullwidth digits
+        "2024-2-29",
+        "2024-02-29T00:00",
+        "2023-02-29",
+    ],
+)
+def test_parse_yyyy_mm_dd_rejects_non_iso_input(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_yyyy_mm_dd(value)